@@ -1,12 +1,38 @@
 """Subject detection module using YOLO and face detection."""
 
+import io
+import threading
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Literal
+from typing import TYPE_CHECKING, Literal
 
 import cv2
 import numpy as np
-from ultralytics import YOLO
+from PIL import Image
+
+if TYPE_CHECKING:
+    # Pulls in torch; imported for real on first model use
+    from ultralytics import YOLO
+    from ultralytics.engine.results import Results
+
+# Optional: libjpeg-turbo's own SIMD decoder is faster than OpenCV's JPEG path
+try:
+    from turbojpeg import TJPF_BGR, TurboJPEG
+
+    _turbo_jpeg = TurboJPEG()
+except (ImportError, OSError, RuntimeError):
+    _turbo_jpeg = None
+
+# EXIF orientation -> transform to upright, matching cv2.imdecode
+_EXIF_TRANSFORMS = {
+    2: lambda img: cv2.flip(img, 1),
+    3: lambda img: cv2.rotate(img, cv2.ROTATE_180),
+    4: lambda img: cv2.flip(img, 0),
+    5: cv2.transpose,
+    6: lambda img: cv2.rotate(img, cv2.ROTATE_90_CLOCKWISE),
+    7: lambda img: cv2.flip(cv2.transpose(img), -1),
+    8: lambda img: cv2.rotate(img, cv2.ROTATE_90_COUNTERCLOCKWISE),
+}
 
 
 @dataclass
@@ -42,6 +68,46 @@ class Detection:
         )
 
 
+def read_image(image_path: str | Path) -> np.ndarray | None:
+    """Decode an image file to a BGR array.
+
+    Reads the file in one call and decodes from memory, which is much faster
+    than cv2.imread on network and cloud-synced folders and also handles
+    non-ASCII paths on Windows.
+
+    Args:
+        image_path: Path to the image file
+
+    Returns:
+        BGR image, or None if the file can't be read or decoded
+    """
+    try:
+        data = np.fromfile(image_path, dtype=np.uint8)
+    except OSError:
+        return None
+    if data.size == 0:
+        return None
+    if _turbo_jpeg is not None and data[:2].tobytes() == b"\xff\xd8":
+        image = _decode_jpeg_turbo(data)
+        if image is not None:
+            return image
+    return cv2.imdecode(data, cv2.IMREAD_COLOR)
+
+
+def _decode_jpeg_turbo(data: np.ndarray) -> np.ndarray | None:
+    """Decode JPEG bytes with libjpeg-turbo, upright per EXIF; None on failure."""
+    raw = data.tobytes()
+    try:
+        image = _turbo_jpeg.decode(raw, pixel_format=TJPF_BGR)
+        # Only the header is parsed here, not the pixels
+        with Image.open(io.BytesIO(raw)) as header:
+            orientation = header.getexif().get(0x0112, 1)
+    except Exception:
+        return None
+    transform = _EXIF_TRANSFORMS.get(orientation)
+    return transform(image) if transform else image
+
+
 def calculate_sharpness(image: np.ndarray, bbox: tuple[float, float, float, float]) -> float:
     """Calculate sharpness of a region using Laplacian variance.
 
@@ -110,11 +176,15 @@ class SubjectDetector:
         self._yolo_model: YOLO | None = None
         self._face_cascade: cv2.CascadeClassifier | None = None
         self._yolo_face_model: YOLO | None = None
+        # Models aren't safe to call concurrently; decoding and sharpness are
+        self._inference_lock = threading.Lock()
 
     @property
-    def yolo_model(self) -> YOLO:
+    def yolo_model(self) -> "YOLO":
         """Lazy-load YOLO model."""
         if self._yolo_model is None:
+            from ultralytics import YOLO
+
             self._yolo_model = YOLO(self.yolo_model_name)
         return self._yolo_model
 
@@ -126,6 +196,18 @@ class SubjectDetector:
             self._face_cascade = cv2.CascadeClassifier(cascade_path)
         return self._face_cascade
 
+    def load_models(self) -> None:
+        """Load model weights now rather than on the first detection.
+
+        Safe to run on a background thread: detections wait for it to finish.
+        Load errors are left for the first detection to raise.
+        """
+        with self._inference_lock:
+            try:
+                self.yolo_model
+            except Exception:
+                pass
+
     def detect(self, image_path: str | Path) -> list[Detection]:
         """Detect subjects in an image.
 
@@ -135,85 +217,126 @@ class SubjectDetector:
         Returns:
             List of Detection objects sorted by confidence (highest first)
         """
-        image_path = Path(image_path)
-        if not image_path.exists():
-            raise FileNotFoundError(f"Image not found: {image_path}")
+        return self.detect_batch([image_path])[0]
 
-        # Load image
-        image = cv2.imread(str(image_path))
-        if image is None:
-            raise ValueError(f"Failed to load image: {image_path}")
+    def detect_batch(self, image_paths: list[str | Path]) -> list[list[Detection]]:
+        """Detect subjects in several images with a single YOLO call.
 
-        height, width = image.shape[:2]
+        Args:
+            image_paths: Paths to the image files
 
-        # Try person detection first
-        detections = self._detect_yolo(image, width, height)
+        Returns:
+            One list of Detection objects per path, in the same order,
+            each sorted by confidence (highest first)
+        """
+        images = [self._load_image(Path(p)) for p in image_paths]
+        return self.detect_images(images)
 
-        # If no person detected, try face detection as fallback
-        if not detections:
-            detections = self._detect_faces(image, width, height)
+    def detect_images(self, images: list[np.ndarray]) -> list[list[Detection]]:
+        """Detect subjects in already-decoded images with a single YOLO call.
 
-        # Calculate sharpness for each detection
-        for det in detections:
-            det.sharpness = calculate_sharpness(image, det.bbox)
+        Args:
+            images: OpenCV images (BGR)
 
-        # Sort by confidence (highest first)
-        detections.sort(key=lambda d: d.confidence, reverse=True)
+        Returns:
+            One list of Detection objects per image, in the same order,
+            each sorted by confidence (highest first)
+        """
+        if not images:
+            return []
 
-        return detections
+        with self._inference_lock:
+            # Try person detection first
+            batch_detections = self._detect_yolo(images)
 
-    def _detect_yolo(
-        self,
-        image: np.ndarray,
-        img_width: int,
-        img_height: int
-    ) -> list[Detection]:
+            # If no person detected, try face detection as fallback
+            for i, image in enumerate(images):
+                if not batch_detections[i]:
+                    height, width = image.shape[:2]
+                    batch_detections[i] = self._detect_faces(image, width, height)
+
+        for image, detections in zip(images, batch_detections):
+            # Calculate sharpness for each detection
+            for det in detections:
+                det.sharpness = calculate_sharpness(image, det.bbox)
+
+            # Sort by confidence (highest first)
+            detections.sort(key=lambda d: d.confidence, reverse=True)
+
+        return batch_detections
+
+    def _load_image(self, image_path: Path) -> np.ndarray:
+        """Decode an image file to a BGR array."""
+        if not image_path.exists():
+            raise FileNotFoundError(f"Image not found: {image_path}")
+
+        image = read_image(image_path)
+        if image is None:
+            raise ValueError(f"Failed to load image: {image_path}")
+        return image
+
+    def _detect_yolo(self, images: list[np.ndarray]) -> list[list[Detection]]:
         """Run YOLO detection for persons.
 
         Args:
-            image: OpenCV image (BGR)
+            images: OpenCV images (BGR), inferred as one batch
+
+        Returns:
+            One list of person Detection objects per image
+        """
+        results = self.yolo_model(images, verbose=False)
+        return [
+            self._parse_yolo_result(result, image.shape[1], image.shape[0])
+            for result, image in zip(results, images)
+        ]
+
+    def _parse_yolo_result(
+        self, result: "Results", img_width: int, img_height: int
+    ) -> list[Detection]:
+        """Convert one YOLO result to normalized person detections.
+
+        Args:
+            result: Ultralytics result for a single image
             img_width: Image width in pixels
             img_height: Image height in pixels
 
         Returns:
             List of Detection objects for persons
         """
-        results = self.yolo_model(image, verbose=False)
         detections = []
 
-        for result in results:
-            boxes = result.boxes
-            if boxes is None:
-                continue
+        boxes = result.boxes
+        if boxes is None:
+            return detections
 
-            for i in range(len(boxes)):
-                cls = int(boxes.cls[i])
-                conf = float(boxes.conf[i])
+        for i in range(len(boxes)):
+            cls = int(boxes.cls[i])
+            conf = float(boxes.conf[i])
 
-                # Only detect persons
-                if cls != self.PERSON_CLASS_ID:
-                    continue
+            # Only detect persons
+            if cls != self.PERSON_CLASS_ID:
+                continue
 
-                if conf < self.confidence_threshold:
-                    continue
+            if conf < self.confidence_threshold:
+                continue
 
-                # Get bounding box (xyxy format)
-                box = boxes.xyxy[i].cpu().numpy()
-                x1, y1, x2, y2 = box
+            # Get bounding box (xyxy format)
+            box = boxes.xyxy[i].cpu().numpy()
+            x1, y1, x2, y2 = box
 
-                # Normalize coordinates to 0-1 range
-                bbox = (
-                    float(x1 / img_width),
-                    float(y1 / img_height),
-                    float(x2 / img_width),
-                    float(y2 / img_height)
-                )
+            # Normalize coordinates to 0-1 range
+            bbox = (
+                float(x1 / img_width),
+                float(y1 / img_height),
+                float(x2 / img_width),
+                float(y2 / img_height)
+            )
 
-                detections.append(Detection(
-                    bbox=bbox,
-                    confidence=conf,
-                    label="person"
-                ))
+            detections.append(Detection(
+                bbox=bbox,
+                confidence=conf,
+                label="person"
+            ))
 
         return detections
 
@@ -280,7 +403,7 @@ class SubjectDetector:
             Tuple of (detections, annotated_image)
         """
         image_path = Path(image_path)
-        image = cv2.imread(str(image_path))
+        image = read_image(image_path)
         if image is None:
             raise ValueError(f"Failed to load image: {image_path}")
 
@@ -179,6 +179,9 @@ class MainWindow(ctk.CTk):
         self._shoot_type = ctk.StringVar(value="Portraits")
         self._destination = ctk.StringVar(value="Client Gallery")
         self._auto_detecting = False
+        self._detect_epoch = 0
+        # Shared by every queue row; each CTkFont is a separate Tk named font
+        self._queue_font = ctk.CTkFont(size=12)
 
         self._preset_buttons: dict[str, ctk.CTkButton] = {}
 
@@ -437,6 +440,8 @@ class MainWindow(ctk.CTk):
         self._queue_scroll = ctk.CTkScrollableFrame(queue_frame, fg_color=BRAND_COLORS["bg_primary"], height=120)
         self._queue_scroll.pack(fill="x", padx=12, pady=(0, 10))
         self._queue_scroll.grid_columnconfigure(0, weight=1)
+        # One delegated click handler instead of per-row bindings
+        self.bind_all("<Button-1>", self._on_queue_click, add="+")
 
         self._drop_hint = ctk.CTkLabel(
             self._queue_scroll, text="Drag & drop files here",
@@ -677,15 +682,14 @@ class MainWindow(ctk.CTk):
                 self._set_preset(preset_label, w, h)
 
     def _run_auto_detect(self):
-        """Run auto-detection on queued images."""
-        if self._auto_detecting:
-            return
-
+        """Run auto-detection on queued images, superseding any run in flight."""
         if not self._queue:
             messagebox.showinfo("No Images", "Add some images to auto-detect shoot type.")
             self._shoot_type.set("Portraits")
             return
 
+        self._detect_epoch += 1
+        epoch = self._detect_epoch
         self._auto_detecting = True
         self._status_var.set("Analyzing images...")
         self._shoot_type_menu.configure(state="disabled")
@@ -698,22 +702,35 @@ class MainWindow(ctk.CTk):
                 image_paths = [item["path"] for item in self._queue[:5]]  # Sample first 5
 
                 def progress(current, total):
-                    self.after(0, lambda: self._status_var.set(f"Analyzing image {current+1}/{total}..."))
+                    if epoch == self._detect_epoch:
+                        self.after(0, self._status_var.set, f"Analyzing image {current+1}/{total}...")
 
-                category_key, preset, confidence, scores = auto_detect_shoot_type(image_paths, progress)
+                category_key, preset, confidence, scores = auto_detect_shoot_type(
+                    image_paths, progress, is_cancelled=lambda: epoch != self._detect_epoch,
+                )
 
                 # Update UI on main thread
-                self.after(0, lambda: self._auto_detect_complete(preset.name, confidence, scores))
+                self.after(0, self._auto_detect_complete, epoch, preset.name, confidence, scores)
 
             except ImportError as e:
-                self.after(0, lambda: self._auto_detect_failed(f"CLIP not installed: {e}"))
+                self.after(0, self._auto_detect_failed, epoch, f"CLIP not installed: {e}")
             except Exception as e:
-                self.after(0, lambda: self._auto_detect_failed(str(e)))
+                self.after(0, self._auto_detect_failed, epoch, str(e))
 
         threading.Thread(target=detect, daemon=True).start()
 
-    def _auto_detect_complete(self, detected_type: str, confidence: float, scores: dict):
+    def _cancel_auto_detect(self):
+        """Invalidate any in-flight auto-detect so its result is discarded."""
+        if not self._auto_detecting:
+            return
+        self._detect_epoch += 1
+        self._auto_detecting = False
+        self._shoot_type_menu.configure(state="normal")
+
+    def _auto_detect_complete(self, epoch: int, detected_type: str, confidence: float, scores: dict):
         """Handle auto-detection completion."""
+        if epoch != self._detect_epoch:
+            return
         self._auto_detecting = False
         self._shoot_type_menu.configure(state="normal")
 
@@ -723,8 +740,10 @@ class MainWindow(ctk.CTk):
 
         self._status_var.set(f"Detected: {detected_type} ({confidence:.0%} confidence)")
 
-    def _auto_detect_failed(self, error: str):
+    def _auto_detect_failed(self, epoch: int, error: str):
         """Handle auto-detection failure."""
+        if epoch != self._detect_epoch:
+            return
         self._auto_detecting = False
         self._shoot_type_menu.configure(state="normal")
         self._shoot_type.set("Portraits")
@@ -866,6 +885,7 @@ class MainWindow(ctk.CTk):
         self._update_queue_display()
 
     def _clear_queue(self):
+        self._cancel_auto_detect()
         self._queue.clear()
         self._selected_index = -1
         self._update_queue_display()
@@ -884,7 +904,7 @@ class MainWindow(ctk.CTk):
         if not self._queue:
             self._drop_hint = ctk.CTkLabel(
                 self._queue_scroll, text="Drag & drop files here\nor use buttons above",
-                text_color="gray", font=ctk.CTkFont(size=12)
+                text_color="gray", font=self._queue_font
             )
             self._drop_hint.grid(row=0, column=0, pady=40)
             return
@@ -904,24 +924,31 @@ class MainWindow(ctk.CTk):
             row_frame.grid(row=i, column=0, sticky="ew", pady=1)
             row_frame.grid_columnconfigure(1, weight=1)
 
-            # Make clickable
-            row_frame.bind("<Button-1>", lambda e, idx=i: self._select_queue_item(idx))
-
             icon_label = ctk.CTkLabel(row_frame, text=icon, text_color=color, width=24)
             icon_label.grid(row=0, column=0, padx=(8, 4))
-            icon_label.bind("<Button-1>", lambda e, idx=i: self._select_queue_item(idx))
 
             name_label = ctk.CTkLabel(
                 row_frame, text=item["path"].name,
-                font=ctk.CTkFont(size=12), anchor="w"
+                font=self._queue_font, anchor="w"
             )
             name_label.grid(row=0, column=1, sticky="w", padx=4)
-            name_label.bind("<Button-1>", lambda e, idx=i: self._select_queue_item(idx))
 
             # Highlight selected
             if i == self._selected_index:
                 row_frame.configure(fg_color=BRAND_COLORS["bg_tertiary"])
 
+    def _on_queue_click(self, event):
+        """Select the queue row containing the clicked widget, if any."""
+        widget = event.widget
+        while isinstance(widget, tk.Misc) and widget.master is not self._queue_scroll:
+            widget = widget.master
+        if not isinstance(widget, tk.Misc):
+            return
+
+        row = int(widget.grid_info().get("row", -1))
+        if 0 <= row < len(self._queue):
+            self._select_queue_item(row)
+
     def _select_queue_item(self, index: int):
         """Select a queue item."""
         self._selected_index = index
@@ -1,15 +1,68 @@
 """Preview widget for displaying images with draggable crop overlay."""
 
+import threading
 import tkinter as tk
+import tkinter.font as tkfont
+from functools import lru_cache
 from pathlib import Path
 from typing import Callable
 
 import customtkinter as ctk
-from PIL import Image, ImageDraw, ImageFont, ImageTk
+from PIL import Image, ImageTk
 
 from ..crop_calculator import CropRegion
 from ..detector import Detection
 
+OVERLAY_FONT_FAMILY = "Segoe UI"
+
+
+@lru_cache(maxsize=8)
+def _get_font(size: int) -> tkfont.Font:
+    """Get the shared overlay font at a given size, resolved once."""
+    return tkfont.Font(family=OVERLAY_FONT_FAMILY, size=size)
+
+
+@lru_cache(maxsize=64)
+def _text_extent(text: str, size: int) -> tuple[int, int]:
+    """Measure overlay text as (width, height) in pixels."""
+    font = _get_font(size)
+    return font.measure(text), font.metrics("linespace")
+
+
+@lru_cache(maxsize=32)
+def _shade_tile(width: int, height: int) -> ImageTk.PhotoImage:
+    """A translucent black image for one crop shade band, at alpha 160.
+
+    Used where canvas stipple isn't drawn (Tk on macOS renders it solid).
+    Cached since the bands keep the same sizes while a crop is dragged
+    along one axis.
+    """
+    return ImageTk.PhotoImage(Image.new("RGBA", (width, height), (0, 0, 0, 160)))
+
+
+@lru_cache(maxsize=16)
+def _decode_preview(
+    path: str, mtime_ns: int, bound: tuple[int, int]
+) -> tuple[Image.Image, tuple[int, int]]:
+    """Decode a screen-bounded RGB working copy of an image.
+
+    Cached so flicking back to a recently viewed file skips the decode; the
+    mtime in the key makes a rewritten file decode again. Callers must not
+    modify the returned image.
+
+    Returns:
+        Tuple of (working copy, full-resolution (width, height))
+    """
+    image = Image.open(path)
+    image_size = image.size
+    # JPEG only: let libjpeg decode at a reduced DCT scale
+    image.draft("RGB", bound)
+    image.thumbnail(bound, Image.Resampling.LANCZOS)
+    # Normalize once here so every display resize is directly blittable
+    if image.mode != "RGB":
+        image = image.convert("RGB")
+    return image, image_size
+
 
 class PreviewWidget(ctk.CTkFrame):
     """Widget for displaying image previews with draggable crop overlay."""
@@ -17,6 +70,19 @@ class PreviewWidget(ctk.CTkFrame):
     # Brand color for accent
     BRAND_ORANGE = "#FF6B35"
 
+    # Delay before redrawing after the last <Configure> event
+    RESIZE_DEBOUNCE_MS = 50
+
+    # Overlay colors (glows are pre-blended since Tk has no alpha)
+    CROP_BORDER_COLOR = "#0096FF"
+    CROP_GLOW_COLOR = "#0E4370"
+    DETECTION_COLOR = "#4EC9B0"
+    DETECTION_GLOW_COLOR = "#276459"
+
+    # Keys of the persistent crop canvas items
+    SHADE_ITEMS = ("shade_top", "shade_bottom", "shade_left", "shade_right")
+    HANDLE_ITEMS = ("handle_nw", "handle_ne", "handle_sw", "handle_se")
+
     def __init__(
         self,
         parent,
@@ -29,9 +95,14 @@ class PreviewWidget(ctk.CTkFrame):
         # Callback when user clicks empty preview (to add files)
         self._on_empty_click = on_empty_click
 
+        # Display working copy, bounded to the screen size; full-res size kept separately
         self._current_image: Image.Image | None = None
+        self._image_size: tuple[int, int] = (0, 0)
+        self._load_generation = 0
         self._current_path: Path | None = None
         self._photo_image: ImageTk.PhotoImage | None = None
+        self._photo_size: tuple[int, int] = (0, 0)
+        self._preview_item_id: int | None = None
         self._crop: CropRegion | None = None
         self._detection: Detection | None = None
         self._aspect_ratio: tuple[int, int] = (4, 5)
@@ -44,7 +115,24 @@ class PreviewWidget(ctk.CTkFrame):
         self._dragging = False
         self._drag_start_x = 0
         self._drag_start_y = 0
-        self._drag_start_crop: CropRegion | None = None
+        # (left, top, width, height) of the crop when the drag started
+        self._drag_origin: tuple[float, float, float, float] | None = None
+        # Crop rectangle in canvas pixels as last drawn, for hit-testing
+        self._crop_display_rect: tuple[int, int, int, int] | None = None
+        # Persistent shade / border / handle canvas items, created on first crop draw
+        self._crop_items: dict[str, int] | None = None
+        # Whether the shade bands are translucent images instead of stippled rectangles
+        self._shade_with_images = False
+        # Persistent detection box / label canvas items, created on first detection draw
+        self._detection_items: dict[str, int] | None = None
+        self._detection_label = ""
+        # Persistent AR pill / hint canvas items, created on first crop draw
+        self._label_items: dict[str, int] | None = None
+        self._label_ar_text = ""
+        # Half-size of the AR pill, measured when the AR text changes
+        self._label_pill_pad = (0, 0)
+        self._redraw_pending = False
+        self._resize_after: str | None = None
 
         # Display metrics
         self._display_scale = 1.0
@@ -52,6 +140,15 @@ class PreviewWidget(ctk.CTkFrame):
         self._display_offset_y = 0
         self._display_width = 0
         self._display_height = 0
+        # Canvas size as reported by <Configure>, so redraws skip the Tcl round-trip
+        self._canvas_width = 1
+        self._canvas_height = 1
+
+        # Key of the resized base currently uploaded to the PhotoImage; the
+        # pixels themselves live only in Tk, reused across drag redraws
+        self._resized_key: tuple[int, int, int] | None = None
+        self._resized_is_draft = False
+        self._last_draw_key: tuple | None = None
 
         self._setup_ui()
 
@@ -82,8 +179,8 @@ class PreviewWidget(ctk.CTkFrame):
         )
         self.canvas.pack(fill="both", expand=True, padx=4, pady=(0, 4))
 
-        # Empty state elements (more prominent)
-        self._empty_state_ids = []
+        # Empty state elements by name (more prominent)
+        self._empty_state_items: dict[str, int] = {}
 
         # Bind events
         self.canvas.bind("<Configure>", self._on_resize)
@@ -92,24 +189,36 @@ class PreviewWidget(ctk.CTkFrame):
         self.canvas.bind("<ButtonRelease-1>", self._on_mouse_up)
 
     def _on_resize(self, event):
-        """Handle canvas resize."""
+        """Handle canvas resize, debounced so a window drag redraws once."""
+        # <Configure> also fires for moves and border changes
+        if (event.width, event.height) == (self._canvas_width, self._canvas_height):
+            return
+        self._canvas_width = event.width
+        self._canvas_height = event.height
+        if self._resize_after is not None:
+            self.after_cancel(self._resize_after)
+        self._resize_after = self.after(self.RESIZE_DEBOUNCE_MS, self._do_resize)
+
+    def _do_resize(self):
+        """Redraw for the settled canvas size."""
+        self._resize_after = None
+        # The resized base is keyed by display size, so _draw_preview only
+        # resamples when the fitted image size actually changed
         if self._current_image is not None:
             self._draw_preview()
         else:
             self._draw_empty_state()
 
     def _draw_empty_state(self):
-        """Draw a prominent empty state with upload call-to-action."""
-        # Clear any existing empty state elements
-        for item_id in self._empty_state_ids:
-            self.canvas.delete(item_id)
-        self._empty_state_ids = []
+        """Draw a prominent empty state with upload call-to-action.
 
+        Items are created once and repositioned on later calls.
+        """
         # Change cursor to hand pointer when empty (clickable)
         self.canvas.config(cursor="hand2")
 
-        canvas_width = self.canvas.winfo_width()
-        canvas_height = self.canvas.winfo_height()
+        canvas_width = self._canvas_width
+        canvas_height = self._canvas_height
 
         if canvas_width <= 1 or canvas_height <= 1:
             return
@@ -117,55 +226,67 @@ class PreviewWidget(ctk.CTkFrame):
         center_x = canvas_width // 2
         center_y = canvas_height // 2
 
-        # Draw dashed border rectangle (drop zone indicator)
+        # Drop zone border inset from the canvas edges
         padding = 40
-        x1, y1 = padding, padding
-        x2, y2 = canvas_width - padding, canvas_height - padding
+        positions = {
+            "border": (padding, padding, canvas_width - padding, canvas_height - padding),
+            "icon": (center_x, center_y - 50),
+            "title": (center_x, center_y + 20),
+            "subtitle": (center_x, center_y + 55),
+            "formats": (center_x, center_y + 85),
+            "error": (center_x, center_y),
+        }
+
+        if "border" in self._empty_state_items:
+            for name, item_id in self._empty_state_items.items():
+                self.canvas.coords(item_id, *positions[name])
+            return
 
-        # Create dashed border effect with multiple rectangles
-        dash_id = self.canvas.create_rectangle(
-            x1, y1, x2, y2,
+        # Dashed border rectangle (drop zone indicator)
+        self._empty_state_items["border"] = self.canvas.create_rectangle(
+            *positions["border"],
             outline="#3a3a3a",
             width=2,
             dash=(10, 6),
         )
-        self._empty_state_ids.append(dash_id)
 
         # Upload icon (using unicode symbol)
-        icon_id = self.canvas.create_text(
-            center_x, center_y - 50,
+        self._empty_state_items["icon"] = self.canvas.create_text(
+            *positions["icon"],
             text="📁",
             font=("Segoe UI Emoji", 48),
             fill="#555555",
         )
-        self._empty_state_ids.append(icon_id)
 
         # Main instruction text with brand color
-        main_text_id = self.canvas.create_text(
-            center_x, center_y + 20,
+        self._empty_state_items["title"] = self.canvas.create_text(
+            *positions["title"],
             text="Drop photos here to get started",
             font=("Segoe UI", 18, "bold"),
             fill=self.BRAND_ORANGE,
         )
-        self._empty_state_ids.append(main_text_id)
 
         # Secondary instruction - make it clickable hint
-        secondary_text_id = self.canvas.create_text(
-            center_x, center_y + 55,
+        self._empty_state_items["subtitle"] = self.canvas.create_text(
+            *positions["subtitle"],
             text="Click here or use +Files / +Folder in sidebar",
             font=("Segoe UI", 12),
             fill="#888888",
         )
-        self._empty_state_ids.append(secondary_text_id)
 
         # Supported formats hint
-        formats_text_id = self.canvas.create_text(
-            center_x, center_y + 85,
+        self._empty_state_items["formats"] = self.canvas.create_text(
+            *positions["formats"],
             text="Supports JPG, PNG, TIFF, RAW (CR2, CR3, NEF, ARW, DNG, RAF)",
             font=("Segoe UI", 10),
             fill="#555555",
         )
-        self._empty_state_ids.append(formats_text_id)
+
+    def _clear_empty_state(self):
+        """Remove all empty-state and error items from the canvas."""
+        for item_id in self._empty_state_items.values():
+            self.canvas.delete(item_id)
+        self._empty_state_items = {}
 
     def _on_mouse_down(self, event):
         """Start dragging the crop or trigger file add when empty."""
@@ -178,36 +299,26 @@ class PreviewWidget(ctk.CTkFrame):
         if self._crop is None:
             return
 
-        crop_left = self._display_offset_x + int(self._crop.left * self._display_width)
-        crop_top = self._display_offset_y + int(self._crop.top * self._display_height)
-        crop_right = self._display_offset_x + int(self._crop.right * self._display_width)
-        crop_bottom = self._display_offset_y + int(self._crop.bottom * self._display_height)
+        if self._crop_display_rect is None:
+            return
 
+        crop_left, crop_top, crop_right, crop_bottom = self._crop_display_rect
         if crop_left <= event.x <= crop_right and crop_top <= event.y <= crop_bottom:
             self._dragging = True
             self._drag_start_x = event.x
             self._drag_start_y = event.y
-            self._drag_start_crop = CropRegion(
-                left=self._crop.left,
-                right=self._crop.right,
-                top=self._crop.top,
-                bottom=self._crop.bottom,
-            )
+            crop = self._crop
+            self._drag_origin = (crop.left, crop.top, crop.width, crop.height)
             self.canvas.config(cursor="fleur")
 
     def _on_mouse_drag(self, event):
         """Handle crop dragging."""
-        if not self._dragging or self._drag_start_crop is None:
+        if not self._dragging or self._drag_origin is None:
             return
 
-        dx = (event.x - self._drag_start_x) / self._display_width
-        dy = (event.y - self._drag_start_y) / self._display_height
-
-        crop_width = self._drag_start_crop.width
-        crop_height = self._drag_start_crop.height
-
-        new_left = self._drag_start_crop.left + dx
-        new_top = self._drag_start_crop.top + dy
+        start_left, start_top, crop_width, crop_height = self._drag_origin
+        new_left = start_left + (event.x - self._drag_start_x) / self._display_width
+        new_top = start_top + (event.y - self._drag_start_y) / self._display_height
 
         new_left = max(0, min(1 - crop_width, new_left))
         new_top = max(0, min(1 - crop_height, new_top))
@@ -219,8 +330,22 @@ class PreviewWidget(ctk.CTkFrame):
             bottom=new_top + crop_height,
         )
 
+        self._schedule_redraw()
+
+    def _schedule_redraw(self):
+        """Coalesce redraw requests into a single idle-time redraw."""
+        if not self._redraw_pending:
+            self._redraw_pending = True
+            self.after_idle(self._do_redraw)
+
+    def _do_redraw(self):
+        """Run a coalesced redraw.
+
+        Info labels are left alone: dragging only translates the crop, so the
+        displayed crop size can't change.
+        """
+        self._redraw_pending = False
         self._draw_preview()
-        self._update_info_labels()
 
     def _on_mouse_up(self, event):
         """End dragging."""
@@ -228,6 +353,10 @@ class PreviewWidget(ctk.CTkFrame):
             self._dragging = False
             self.canvas.config(cursor="crosshair")
 
+            if self._resized_is_draft:
+                self._resized_key = None
+                self._schedule_redraw()
+
             if self._on_crop_changed and self._crop:
                 self._on_crop_changed(self._crop)
 
@@ -251,19 +380,29 @@ class PreviewWidget(ctk.CTkFrame):
             ar_text = f"Aspect: {w}:{h} (portrait)"
         self._ar_label.configure(text=ar_text)
 
-        img_w, img_h = self._current_image.size
+        img_w, img_h = self._image_size
         crop_w = int(self._crop.width * img_w)
         crop_h = int(self._crop.height * img_h)
         self._dim_label.configure(text=f"Crop: {crop_w} × {crop_h}px")
 
     def clear(self):
         """Clear the preview."""
+        self._load_generation += 1
         self._current_image = None
         self._current_path = None
-        self._photo_image = None
+        self._crop_display_rect = None
+        self._last_draw_key = None
+        self._resized_key = None
         self._crop = None
         self._detection = None
-        self.canvas.delete("preview")
+        # Keep the PhotoImage so a next image of the same display size is pasted into it
+        self.canvas.itemconfigure("preview", state="hidden")
+        self.canvas.delete("crop")
+        self.canvas.delete("detection")
+        self.canvas.delete("labels")
+        self._crop_items = None
+        self._detection_items = None
+        self._label_items = None
         self._ar_label.configure(text="")
         self._dim_label.configure(text="")
         # Redraw empty state
@@ -275,40 +414,70 @@ class PreviewWidget(ctk.CTkFrame):
         crop: CropRegion | None = None,
         detection: Detection | None = None,
     ):
-        """Load and display an image with optional crop overlay."""
-        try:
-            self._current_image = Image.open(image_path)
-            self._current_path = image_path
-            self._crop = crop
-            self._detection = detection
-            # Clear empty state elements
-            for item_id in self._empty_state_ids:
-                self.canvas.delete(item_id)
-            self._empty_state_ids = []
-            # Restore crosshair cursor for image interaction
-            self.canvas.config(cursor="crosshair")
-            self._draw_preview()
-            self._update_info_labels()
-        except Exception as e:
-            self.clear()
-            # Show error on canvas
-            canvas_width = self.canvas.winfo_width()
-            canvas_height = self.canvas.winfo_height()
-            error_id = self.canvas.create_text(
-                canvas_width // 2, canvas_height // 2,
-                text=f"Error loading image:\n{e}",
-                fill="#EF4444",
-                font=("Segoe UI", 12),
-            )
-            self._empty_state_ids.append(error_id)
+        """Load and display an image with optional crop overlay.
+
+        The file is decoded on a background thread; the current preview stays
+        up until the new image is ready. Loads superseded by a newer call are
+        discarded.
+        """
+        self._load_generation += 1
+        generation = self._load_generation
+        self._current_path = image_path
+        self._crop = crop
+        self._detection = detection
+        # The preview can never exceed the screen, so never keep more pixels than that
+        bound = (self.winfo_screenwidth(), self.winfo_screenheight())
+
+        def decode():
+            try:
+                mtime_ns = image_path.stat().st_mtime_ns
+                image, image_size = _decode_preview(str(image_path), mtime_ns, bound)
+            except Exception as e:
+                self.after(0, self._load_failed, generation, str(e))
+                return
+            self.after(0, self._finish_load, generation, image, image_size)
+
+        threading.Thread(target=decode, daemon=True).start()
+
+    def _finish_load(self, generation: int, image: Image.Image, image_size: tuple[int, int]):
+        """Install a decoded image (runs on the Tk thread)."""
+        if generation != self._load_generation:
+            return
+
+        self._current_image = image
+        self._image_size = image_size
+        self._resized_key = None
+        self._clear_empty_state()
+        # Restore crosshair cursor for image interaction
+        self.canvas.config(cursor="crosshair")
+        self._draw_preview()
+        self._update_info_labels()
+
+    def _load_failed(self, generation: int, error: str):
+        """Show a load error on the canvas (runs on the Tk thread)."""
+        if generation != self._load_generation:
+            return
+
+        self.clear()
+        if "error" in self._empty_state_items:
+            self.canvas.delete(self._empty_state_items["error"])
+        # Show error on canvas
+        canvas_width = self._canvas_width
+        canvas_height = self._canvas_height
+        self._empty_state_items["error"] = self.canvas.create_text(
+            canvas_width // 2, canvas_height // 2,
+            text=f"Error loading image:\n{error}",
+            fill="#EF4444",
+            font=("Segoe UI", 12),
+        )
 
     def update_crop(self, crop: CropRegion | None, detection: Detection | None = None):
         """Update the crop overlay without reloading the image."""
         self._crop = crop
         self._detection = detection
         if self._current_image is not None:
-            self._draw_preview()
             self._update_info_labels()
+            self._schedule_redraw()
 
     def get_crop(self) -> CropRegion | None:
         """Get the current crop region."""
@@ -319,12 +488,27 @@ class PreviewWidget(ctk.CTkFrame):
         if self._current_image is None:
             return
 
-        canvas_width = self.canvas.winfo_width()
-        canvas_height = self.canvas.winfo_height()
+        canvas_width = self._canvas_width
+        canvas_height = self._canvas_height
 
         if canvas_width <= 1 or canvas_height <= 1:
             return
 
+        crop = self._crop
+        detection = self._detection
+        draw_key = (
+            id(self._current_image),
+            canvas_width,
+            canvas_height,
+            crop and (crop.left, crop.top, crop.right, crop.bottom),
+            detection and (detection.bbox, detection.label, detection.confidence),
+            self._aspect_ratio,
+            self._is_landscape,
+        )
+        if draw_key == self._last_draw_key and self._resized_key is not None:
+            return
+        self._last_draw_key = draw_key
+
         img_width, img_height = self._current_image.size
         scale = min(
             (canvas_width - 40) / img_width,
@@ -341,158 +525,226 @@ class PreviewWidget(ctk.CTkFrame):
         self._display_offset_x = (canvas_width - new_width) // 2
         self._display_offset_y = (canvas_height - new_height) // 2
 
-        resized = self._current_image.resize(
-            (new_width, new_height),
-            Image.Resampling.LANCZOS,
-        )
-
-        overlay = resized.copy().convert("RGBA")
-        draw = ImageDraw.Draw(overlay)
-
-        if self._crop is not None:
-            crop_left = int(self._crop.left * new_width)
-            crop_top = int(self._crop.top * new_height)
-            crop_right = int(self._crop.right * new_width)
-            crop_bottom = int(self._crop.bottom * new_height)
-
-            # Darken areas outside crop
-            dark_overlay = Image.new("RGBA", overlay.size, (0, 0, 0, 0))
-            dark_draw = ImageDraw.Draw(dark_overlay)
-
-            if crop_top > 0:
-                dark_draw.rectangle([0, 0, new_width, crop_top], fill=(0, 0, 0, 160))
-            if crop_bottom < new_height:
-                dark_draw.rectangle([0, crop_bottom, new_width, new_height], fill=(0, 0, 0, 160))
-            if crop_left > 0:
-                dark_draw.rectangle([0, crop_top, crop_left, crop_bottom], fill=(0, 0, 0, 160))
-            if crop_right < new_width:
-                dark_draw.rectangle([crop_right, crop_top, new_width, crop_bottom], fill=(0, 0, 0, 160))
-
-            overlay = Image.alpha_composite(overlay, dark_overlay)
-            draw = ImageDraw.Draw(overlay)
-
-            # Draw crop border with glow effect
-            for offset in range(3, 0, -1):
-                alpha = 40 + (3 - offset) * 30
-                draw.rectangle(
-                    [crop_left - offset, crop_top - offset,
-                     crop_right + offset, crop_bottom + offset],
-                    outline=(0, 120, 212, alpha),
-                    width=1,
-                )
-
-            # Main border
-            draw.rectangle(
-                [crop_left, crop_top, crop_right, crop_bottom],
-                outline=(0, 150, 255),
-                width=2,
+        resized_key = (id(self._current_image), new_width, new_height)
+        if self._photo_image is None or self._resized_key != resized_key:
+            # Cheap filter while interacting; upgraded to LANCZOS on mouse-up
+            resample = Image.Resampling.BILINEAR if self._dragging else Image.Resampling.LANCZOS
+            # reducing_gap box-reduces by an integer factor first when shrinking a lot
+            resized = self._current_image.resize(
+                (new_width, new_height), resample, reducing_gap=2.0,
             )
-
-            # Corner handles
-            handle_size = 10
-            handle_color = (255, 255, 255)
-            corners = [
-                (crop_left, crop_top),
-                (crop_right, crop_top),
-                (crop_left, crop_bottom),
-                (crop_right, crop_bottom),
-            ]
-            for hx, hy in corners:
-                draw.rectangle(
-                    [hx - handle_size//2, hy - handle_size//2,
-                     hx + handle_size//2, hy + handle_size//2],
-                    fill=handle_color,
-                    outline=(0, 150, 255),
-                    width=2,
-                )
-
-            # Aspect ratio text in center
-            ar_w, ar_h = self._aspect_ratio
-            if self._is_landscape:
-                ar_text = f"{ar_h}:{ar_w}"
-            else:
-                ar_text = f"{ar_w}:{ar_h}"
-
-            text_x = (crop_left + crop_right) // 2
-            text_y = (crop_top + crop_bottom) // 2
-
-            try:
-                font = ImageFont.truetype("segoeui.ttf", 18)
-            except:
-                try:
-                    font = ImageFont.truetype("arial.ttf", 18)
-                except:
-                    font = ImageFont.load_default()
-
-            bbox = draw.textbbox((text_x, text_y), ar_text, font=font, anchor="mm")
-            padding = 8
-            draw.rounded_rectangle(
-                [bbox[0] - padding, bbox[1] - padding,
-                 bbox[2] + padding, bbox[3] + padding],
-                radius=6,
-                fill=(0, 0, 0, 200),
+            self._resized_key = resized_key
+            self._resized_is_draft = self._dragging
+        else:
+            resized = None
+
+        if self._photo_image is None or self._photo_size != (new_width, new_height):
+            self._photo_image = ImageTk.PhotoImage(resized)
+            self._photo_size = (new_width, new_height)
+        elif resized is not None:
+            # Base pixels only change with the image or display size, not the crop
+            self._photo_image.paste(resized)
+
+        # One persistent image item; retargeted and moved rather than recreated
+        if self._preview_item_id is None:
+            self._preview_item_id = self.canvas.create_image(
+                self._display_offset_x,
+                self._display_offset_y,
+                image=self._photo_image,
+                anchor=tk.NW,
+                tags="preview",
             )
-            draw.text((text_x, text_y), ar_text, fill=(255, 255, 255), font=font, anchor="mm")
-
-            # Drag hint
-            if crop_bottom - crop_top > 80:
-                hint_y = crop_bottom - 25
-                try:
-                    hint_font = ImageFont.truetype("segoeui.ttf", 11)
-                except:
-                    hint_font = font
-                draw.text(
-                    ((crop_left + crop_right) // 2, hint_y),
-                    "drag to reposition",
-                    fill=(180, 180, 180),
-                    font=hint_font,
-                    anchor="mm",
-                )
-
-        if self._detection is not None:
-            det_left = int(self._detection.bbox[0] * new_width)
-            det_top = int(self._detection.bbox[1] * new_height)
-            det_right = int(self._detection.bbox[2] * new_width)
-            det_bottom = int(self._detection.bbox[3] * new_height)
-
-            # Detection box with glow
-            for offset in range(2, 0, -1):
-                alpha = 60 + (2 - offset) * 40
-                draw.rectangle(
-                    [det_left - offset, det_top - offset,
-                     det_right + offset, det_bottom + offset],
-                    outline=(78, 201, 176, alpha),
-                    width=1,
+            self.canvas.tag_lower("preview")
+        else:
+            if resized is not None:
+                self.canvas.itemconfigure(
+                    self._preview_item_id, image=self._photo_image, state="normal",
                 )
+            self.canvas.coords(self._preview_item_id, self._display_offset_x, self._display_offset_y)
 
-            draw.rectangle(
-                [det_left, det_top, det_right, det_bottom],
-                outline=(78, 201, 176),
-                width=2,
+        if crop is not None:
+            self._crop_display_rect = self._to_canvas_rect(
+                (crop.left, crop.top, crop.right, crop.bottom)
             )
+            self._draw_crop_overlay(self._crop_display_rect)
+        else:
+            self.canvas.itemconfigure("crop", state="hidden")
+            self.canvas.itemconfigure("labels", state="hidden")
 
-            # Label with background
-            label = f"{self._detection.label} {self._detection.confidence:.0%}"
-            try:
-                label_font = ImageFont.truetype("segoeui.ttf", 12)
-            except:
-                label_font = font if 'font' in dir() else ImageFont.load_default()
-
-            label_bbox = draw.textbbox((det_left, det_top - 20), label, font=label_font)
-            draw.rectangle(
-                [label_bbox[0] - 4, label_bbox[1] - 2,
-                 label_bbox[2] + 4, label_bbox[3] + 2],
-                fill=(78, 201, 176),
+        if detection is not None:
+            self._draw_detection_overlay(self._to_canvas_rect(detection.bbox))
+        else:
+            self.canvas.itemconfigure("detection", state="hidden")
+
+    def _create_crop_items(self) -> dict[str, int]:
+        """Create the shade, glow, border and handle items once; later draws move them."""
+        items = {}
+        # Darken outside the crop with bands above/below/left/right: stippled
+        # rectangles, or translucent images on Aqua, which ignores stipple
+        self._shade_with_images = self.canvas.tk.call("tk", "windowingsystem") == "aqua"
+        for name in self.SHADE_ITEMS:
+            if self._shade_with_images:
+                items[name] = self.canvas.create_image(0, 0, anchor="nw", tags="crop")
+            else:
+                items[name] = self.canvas.create_rectangle(
+                    0, 0, 0, 0, fill="black", stipple="gray50", width=0, tags="crop",
+                )
+        # Glow: one wide outline spanning 1-3px outside the border
+        items["glow"] = self.canvas.create_rectangle(
+            0, 0, 0, 0, outline=self.CROP_GLOW_COLOR, width=3, tags="crop",
+        )
+        items["border"] = self.canvas.create_rectangle(
+            0, 0, 0, 0, outline=self.CROP_BORDER_COLOR, width=2, tags="crop",
+        )
+        for name in self.HANDLE_ITEMS:
+            items[name] = self.canvas.create_rectangle(
+                0, 0, 0, 0, fill="white", outline=self.CROP_BORDER_COLOR, width=2, tags="crop",
             )
-            draw.text((det_left, det_top - 20), label, fill=(0, 0, 0), font=label_font)
-
-        self._photo_image = ImageTk.PhotoImage(overlay)
+        return items
+
+    def _to_canvas_rect(
+        self, bbox: tuple[float, float, float, float]
+    ) -> tuple[int, int, int, int]:
+        """Map a normalized (left, top, right, bottom) box to canvas pixels."""
+        x0 = self._display_offset_x
+        y0 = self._display_offset_y
+        w = self._display_width
+        h = self._display_height
+        return (
+            x0 + int(bbox[0] * w),
+            y0 + int(bbox[1] * h),
+            x0 + int(bbox[2] * w),
+            y0 + int(bbox[3] * h),
+        )
 
-        self.canvas.delete("preview")
-        self.canvas.create_image(
-            canvas_width // 2,
-            canvas_height // 2,
-            image=self._photo_image,
-            anchor=tk.CENTER,
-            tags="preview",
+    def _draw_crop_overlay(self, crop_rect: tuple[int, int, int, int]):
+        """Position the crop shade, border, corner handles and labels."""
+        x0 = self._display_offset_x
+        y0 = self._display_offset_y
+        x1 = x0 + self._display_width
+        y1 = y0 + self._display_height
+        crop_left, crop_top, crop_right, crop_bottom = crop_rect
+
+        if self._crop_items is None:
+            self._crop_items = self._create_crop_items()
+        crop_items = self._crop_items
+        coords = self.canvas.coords
+
+        shade_rects = {
+            "shade_top": (x0, y0, x1, crop_top),
+            "shade_bottom": (x0, crop_bottom, x1, y1),
+            "shade_left": (x0, crop_top, crop_left, crop_bottom),
+            "shade_right": (crop_right, crop_top, x1, crop_bottom),
+        }
+        for name, (left, top, right, bottom) in shade_rects.items():
+            if not self._shade_with_images:
+                # Empty bands (crop touching an edge) collapse to zero-area rectangles
+                coords(crop_items[name], left, top, right, bottom)
+            elif right > left and bottom > top:
+                coords(crop_items[name], left, top)
+                self.canvas.itemconfigure(
+                    crop_items[name], image=_shade_tile(right - left, bottom - top)
+                )
+            else:
+                self.canvas.itemconfigure(crop_items[name], image="")
+        coords(crop_items["glow"], crop_left - 2, crop_top - 2, crop_right + 2, crop_bottom + 2)
+        coords(crop_items["border"], crop_left, crop_top, crop_right, crop_bottom)
+
+        half = 5
+        for name, (hx, hy) in zip(self.HANDLE_ITEMS, (
+            (crop_left, crop_top),
+            (crop_right, crop_top),
+            (crop_left, crop_bottom),
+            (crop_right, crop_bottom),
+        )):
+            coords(crop_items[name], hx - half, hy - half, hx + half, hy + half)
+        self.canvas.itemconfigure("crop", state="normal")
+
+        # Aspect ratio text in center
+        ar_w, ar_h = self._aspect_ratio
+        if self._is_landscape:
+            ar_text = f"{ar_h}:{ar_w}"
+        else:
+            ar_text = f"{ar_w}:{ar_h}"
+
+        if self._label_items is None:
+            self._label_items = {
+                "pill": self.canvas.create_rectangle(
+                    0, 0, 0, 0, fill="black", width=0, tags="labels",
+                ),
+                "ar": self.canvas.create_text(
+                    0, 0, fill="white", font=_get_font(18), tags="labels",
+                ),
+                "hint": self.canvas.create_text(
+                    0, 0, text="drag to reposition", fill="#B4B4B4",
+                    font=_get_font(11), tags="labels",
+                ),
+            }
+            self._label_ar_text = ""
+
+        # Label items persist across redraws; only move them and swap text on change
+        items = self._label_items
+        if ar_text != self._label_ar_text:
+            self.canvas.itemconfigure(items["ar"], text=ar_text)
+            self._label_ar_text = ar_text
+            text_w, text_h = _text_extent(ar_text, 18)
+            self._label_pill_pad = (text_w // 2 + 8, text_h // 2 + 8)
+
+        text_x = (crop_left + crop_right) // 2
+        text_y = (crop_top + crop_bottom) // 2
+        pad_x, pad_y = self._label_pill_pad
+        self.canvas.coords(
+            items["pill"],
+            text_x - pad_x, text_y - pad_y, text_x + pad_x, text_y + pad_y,
         )
+        self.canvas.coords(items["ar"], text_x, text_y)
+        self.canvas.itemconfigure(items["pill"], state="normal")
+        self.canvas.itemconfigure(items["ar"], state="normal")
+
+        # Drag hint
+        if crop_bottom - crop_top > 80:
+            self.canvas.coords(items["hint"], text_x, crop_bottom - 25)
+            self.canvas.itemconfigure(items["hint"], state="normal")
+        else:
+            self.canvas.itemconfigure(items["hint"], state="hidden")
+
+        self.canvas.tag_raise("labels")
+
+    def _draw_detection_overlay(self, det_rect: tuple[int, int, int, int]):
+        """Position the detection box and its label."""
+        det_left, det_top, det_right, det_bottom = det_rect
+
+        if self._detection_items is None:
+            self._detection_items = {
+                # Detection box with glow
+                "glow": self.canvas.create_rectangle(
+                    0, 0, 0, 0, outline=self.DETECTION_GLOW_COLOR, width=2, tags="detection",
+                ),
+                "box": self.canvas.create_rectangle(
+                    0, 0, 0, 0, outline=self.DETECTION_COLOR, width=2, tags="detection",
+                ),
+                # Label with background
+                "label_bg": self.canvas.create_rectangle(
+                    0, 0, 0, 0, fill=self.DETECTION_COLOR, width=0, tags="detection",
+                ),
+                "label": self.canvas.create_text(
+                    0, 0, anchor="nw", fill="black", font=_get_font(12), tags="detection",
+                ),
+            }
+            self._detection_label = ""
+
+        items = self._detection_items
+        label = f"{self._detection.label} {self._detection.confidence:.0%}"
+        if label != self._detection_label:
+            self.canvas.itemconfigure(items["label"], text=label)
+            self._detection_label = label
+
+        coords = self.canvas.coords
+        coords(items["glow"], det_left - 2, det_top - 2, det_right + 2, det_bottom + 2)
+        coords(items["box"], det_left, det_top, det_right, det_bottom)
+
+        label_y = det_top - 20
+        label_w, label_h = _text_extent(label, 12)
+        coords(items["label_bg"], det_left - 4, label_y - 2, det_left + label_w + 4, label_y + label_h + 2)
+        coords(items["label"], det_left, label_y)
+        self.canvas.itemconfigure("detection", state="normal")
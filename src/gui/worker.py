@@ -1,16 +1,25 @@
 """Background worker thread for image processing."""
 
+import math
+import os
 import threading
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from pathlib import Path
 from queue import Queue
-from typing import Callable
+from typing import Callable, Iterator
 
 import cv2
+import numpy as np
+from PIL import Image
 
 from ..crop_calculator import CropRegion, calculate_crop_for_detection, select_primary_subject
-from ..detector import Detection, SubjectDetector
-from ..xmp_handler import write_crop_to_xmp
+from ..detector import Detection, SubjectDetector, read_image
+from ..xmp_handler import write_crops_to_xmp
+
+
+# Concurrent sidecar writes in write_xmp_for_results
+XMP_WRITE_WORKERS = 8
 
 
 @dataclass
@@ -29,6 +38,11 @@ class ProcessingResult:
 class ProcessingWorker:
     """Background worker for processing images."""
 
+    # Threads decoding images; inference is serialized in the detector
+    MAX_WORKERS = 4
+    # Files per detector call
+    BATCH_SIZE = 8
+
     def __init__(
         self,
         on_progress: Callable[[int, int, str], None] | None = None,
@@ -74,6 +88,13 @@ class ProcessingWorker:
             return
 
         self._cancel_flag.clear()
+
+        # Load model weights alongside the first batch's decode rather than
+        # before it; inference waits on the detector's lock until they're in
+        if self._detector is None:
+            self._detector = SubjectDetector()
+            threading.Thread(target=self._detector.load_models, daemon=True).start()
+
         self._thread = threading.Thread(
             target=self._process_files,
             args=(files, aspect_ratio, padding, strategy),
@@ -93,66 +114,125 @@ class ProcessingWorker:
         strategy: str,
     ) -> None:
         """Process files (runs in background thread)."""
-        # Lazy-load detector
-        if self._detector is None:
-            if self.on_progress:
-                self.on_progress(0, len(files), "Loading detection model...")
-            self._detector = SubjectDetector()
-
         results = []
-        for i, file_path in enumerate(files):
-            if self._cancel_flag.is_set():
-                break
+        total = len(files)
+        with ThreadPoolExecutor(max_workers=self.MAX_WORKERS) as executor:
+            for start in range(0, total, self.BATCH_SIZE):
+                if self._cancel_flag.is_set():
+                    break
+
+                batch = files[start:start + self.BATCH_SIZE]
+                if self.on_progress:
+                    self.on_progress(start, total, f"Processing {batch[0].name}...")
 
-            if self.on_progress:
-                self.on_progress(i, len(files), f"Processing {file_path.name}...")
+                batch_results = self._process_batch(batch, executor, aspect_ratio, padding, strategy)
+                for offset, result in enumerate(batch_results):
+                    if self._cancel_flag.is_set():
+                        break
+                    if self.on_progress:
+                        self.on_progress(start + offset, total, f"Processing {result.file_path.name}...")
 
-            result = self._process_single_file(file_path, aspect_ratio, padding, strategy)
-            results.append(result)
+                    results.append(result)
 
-            if self.on_file_complete:
-                self.on_file_complete(result)
+                    if self.on_file_complete:
+                        self.on_file_complete(result)
 
         if self.on_progress:
-            self.on_progress(len(files), len(files), "Complete")
+            self.on_progress(total, total, "Complete")
 
         if self.on_complete:
             self.on_complete(results)
 
-    def _process_single_file(
+    def _process_batch(
         self,
-        file_path: Path,
+        files: list[Path],
+        executor: ThreadPoolExecutor,
         aspect_ratio: tuple[int, int],
         padding: float,
         strategy: str,
-    ) -> ProcessingResult:
-        """Process a single image file."""
+    ) -> Iterator[ProcessingResult]:
+        """Process a batch of files with one detector call, yielding results in order.
+
+        Nothing is detected if processing is cancelled while the batch decodes.
+        """
+        loaded = list(executor.map(self._load_image, files))
+        results = [result for result, _ in loaded]
+        images = [image for _, image in loaded if image is not None]
+        del loaded
+        if self._cancel_flag.is_set():
+            return
+
+        batch_detections: list[list[Detection] | Exception] = []
+        if images:
+            try:
+                batch_detections = self._detector.detect_images(images)
+            except Exception:
+                # e.g. out of memory on the whole batch: retry one image at a
+                # time so only the files that fail on their own are errors
+                batch_detections = [self._detect_one(image) for image in images]
+            # Results keep only the image sizes; free the decoded pixels now
+            # rather than when the batch's results are all consumed
+            images.clear()
+
+        detections_iter = iter(batch_detections)
+        for result in results:
+            if result.status == "pending":
+                detections = next(detections_iter)
+                if isinstance(detections, Exception):
+                    result.status = "error"
+                    result.error_message = str(detections)
+                else:
+                    self._apply_detections(result, detections, aspect_ratio, padding, strategy)
+            yield result
+
+    def _detect_one(self, image: np.ndarray) -> list[Detection] | Exception:
+        """Detect subjects in a single image, returning the exception if it fails."""
+        try:
+            return self._detector.detect_images([image])[0]
+        except Exception as e:
+            return e
+
+    def _load_image(self, file_path: Path) -> tuple[ProcessingResult, np.ndarray | None]:
+        """Decode a file once for both its dimensions and detection."""
         result = ProcessingResult(file_path=file_path, status="pending")
 
         try:
-            # Get image dimensions
-            image = cv2.imread(str(file_path))
-            if image is None:
-                result.status = "error"
-                result.error_message = "Failed to load image"
-                return result
+            image = read_image(file_path)
+        except Exception as e:
+            result.status = "error"
+            result.error_message = str(e)
+            return result, None
+        if image is None:
+            result.status = "error"
+            result.error_message = "Failed to load image"
+            return result, None
 
-            height, width = image.shape[:2]
-            result.image_size = (width, height)
+        height, width = image.shape[:2]
+        result.image_size = (width, height)
+        return result, image
 
-            # Detect subjects
-            detections = self._detector.detect(file_path)
-            result.detections = detections
+    def _apply_detections(
+        self,
+        result: ProcessingResult,
+        detections: list[Detection],
+        aspect_ratio: tuple[int, int],
+        padding: float,
+        strategy: str,
+    ) -> None:
+        """Select the primary subject and calculate the crop for a result."""
+        result.detections = detections
 
-            if not detections:
-                result.status = "no_subject"
-                return result
+        if not detections:
+            result.status = "no_subject"
+            return
 
+        try:
             # Select primary subject
             primary = select_primary_subject(detections, strategy)
             result.primary_detection = primary
 
             # Calculate crop
+            width, height = result.image_size
             crop = calculate_crop_for_detection(
                 primary,
                 image_width=width,
@@ -167,8 +247,6 @@ class ProcessingWorker:
             result.status = "error"
             result.error_message = str(e)
 
-        return result
-
 
 def write_xmp_for_results(
     results: list[ProcessingResult],
@@ -189,24 +267,26 @@ def write_xmp_for_results(
 
     successful = [r for r in results if r.status == "success" and r.crop is not None]
 
-    for i, result in enumerate(successful):
+    if on_progress:
+        on_progress(0, len(successful))
+
+    # Sidecar writes are small and I/O-bound; overlap them
+    written = write_crops_to_xmp(
+        [(r.file_path, r.crop) for r in successful],
+        output_dir=output_dir,
+        backup=True,
+        max_workers=XMP_WRITE_WORKERS,
+    )
+    for i, (result, outcome) in enumerate(zip(successful, written), start=1):
+        if isinstance(outcome, Exception):
+            xmp_results.append((result.file_path, False, str(outcome)))
+        else:
+            xmp_path, changed = outcome
+            message = "XMP written" if changed else "XMP unchanged"
+            xmp_results.append((xmp_path, True, message))
         if on_progress:
             on_progress(i, len(successful))
 
-        try:
-            xmp_path = write_crop_to_xmp(
-                result.file_path,
-                result.crop,
-                output_dir=output_dir,
-                backup=True,
-            )
-            xmp_results.append((xmp_path, True, "XMP written"))
-        except Exception as e:
-            xmp_results.append((result.file_path, False, str(e)))
-
-    if on_progress:
-        on_progress(len(successful), len(successful))
-
     return xmp_results
 
 
@@ -231,25 +311,68 @@ def export_cropped_images(
     Returns:
         List of (output_path, success, message) tuples
     """
-    from PIL import Image
-
     output_dir = Path(output_dir)
     output_dir.mkdir(parents=True, exist_ok=True)
 
     export_results = []
     successful = [r for r in results if r.status == "success" and r.crop is not None]
 
-    for i, result in enumerate(successful):
-        if on_progress:
-            on_progress(i, len(successful))
+    # Pick unique output names up front so the parallel exports can't collide
+    output_paths = []
+    claimed: set[Path] = set()
+    for result in successful:
+        stem = result.file_path.stem
+        output_path = output_dir / f"{stem}{suffix}.jpg"
+
+        # Handle duplicates
+        counter = 1
+        while output_path in claimed or output_path.exists():
+            output_path = output_dir / f"{stem}{suffix}_{counter}.jpg"
+            counter += 1
+
+        claimed.add(output_path)
+        output_paths.append(output_path)
+
+    if on_progress:
+        on_progress(0, len(successful))
+
+    # Decode and encode release the GIL, so threads scale across cores
+    with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+        exported = executor.map(
+            lambda job: _export_cropped_image(*job, jpeg_quality, max_dimension),
+            zip(successful, output_paths),
+        )
+        for i, export_result in enumerate(exported, start=1):
+            export_results.append(export_result)
+            if on_progress:
+                on_progress(i, len(successful))
+
+    return export_results
+
+
+def _export_cropped_image(
+    result: ProcessingResult,
+    output_path: Path,
+    jpeg_quality: int,
+    max_dimension: int | None,
+) -> tuple[Path, bool, str]:
+    """Crop, resize and save one image; returns (path, success, message)."""
+    try:
+        # Load image
+        with Image.open(result.file_path) as img:
+            crop = result.crop
+
+            # Let libjpeg decode at 1/2, 1/4 or 1/8 scale when the crop would
+            # still be at least max_dimension on its long side
+            if max_dimension:
+                width, height = img.size
+                scale = max_dimension / max(crop.width * width, crop.height * height)
+                if scale < 1:
+                    img.draft(img.mode, (math.ceil(width * scale), math.ceil(height * scale)))
 
-        try:
-            # Load image
-            img = Image.open(result.file_path)
             width, height = img.size
 
             # Calculate crop box in pixels
-            crop = result.crop
             left = int(crop.left * width)
             top = int(crop.top * height)
             right = int(crop.right * width)
@@ -265,30 +388,26 @@ def export_cropped_images(
                     scale = max_dimension / max(crop_w, crop_h)
                     new_w = int(crop_w * scale)
                     new_h = int(crop_h * scale)
-                    cropped = cropped.resize((new_w, new_h), Image.Resampling.LANCZOS)
-
-            # Generate output filename
-            stem = result.file_path.stem
-            output_path = output_dir / f"{stem}{suffix}.jpg"
-
-            # Handle duplicates
-            counter = 1
-            while output_path.exists():
-                output_path = output_dir / f"{stem}{suffix}_{counter}.jpg"
-                counter += 1
-
-            # Save as JPEG
-            # Convert to RGB if necessary (for PNG with alpha, etc.)
-            if cropped.mode in ("RGBA", "P"):
-                cropped = cropped.convert("RGB")
-
-            cropped.save(output_path, "JPEG", quality=jpeg_quality)
-            export_results.append((output_path, True, "Exported"))
-
-        except Exception as e:
-            export_results.append((result.file_path, False, str(e)))
-
-    if on_progress:
-        on_progress(len(successful), len(successful))
+                    if cropped.mode in ("RGB", "L"):
+                        # OpenCV's SIMD area filter is ~1.7x faster than LANCZOS for downscales
+                        resized = cv2.resize(
+                            np.asarray(cropped), (new_w, new_h), interpolation=cv2.INTER_AREA
+                        )
+                        cropped = Image.fromarray(resized)
+                    else:
+                        cropped = cropped.resize((new_w, new_h), Image.Resampling.LANCZOS)
+
+        # Save as JPEG
+        # Convert to RGB if necessary (for PNG with alpha, etc.)
+        if cropped.mode in ("RGBA", "P"):
+            cropped = cropped.convert("RGB")
+
+        # Baseline, 4:2:0, no Huffman optimization pass: the cheapest encode
+        cropped.save(
+            output_path, "JPEG", quality=jpeg_quality,
+            optimize=False, progressive=False, subsampling=2,
+        )
+        return output_path, True, "Exported"
 
-    return export_results
+    except Exception as e:
+        return result.file_path, False, str(e)
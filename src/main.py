@@ -1,9 +1,20 @@
 """CLI entry point for Lightroom Subject Crop."""
 
+import json
+import os
+import socket
+import socketserver
+import stat
+import threading
+from collections import Counter
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
+from functools import partial
 from pathlib import Path
-from typing import Annotated, Optional
+from typing import Annotated, BinaryIO, Optional
 
 import cv2
+import numpy as np
 import typer
 from rich.console import Console
 from rich.progress import Progress, SpinnerColumn, TextColumn
@@ -14,7 +25,7 @@ from .crop_calculator import (
     calculate_crop_for_detection,
     select_primary_subject,
 )
-from .detector import Detection, SubjectDetector
+from .detector import Detection, SubjectDetector, read_image
 from .xmp_handler import get_xmp_path, write_crop_to_xmp
 
 app = typer.Typer(
@@ -24,6 +35,39 @@ app = typer.Typer(
 )
 console = Console()
 
+# Default cap on --workers for CPU inference; each worker holds its own copy
+# of the model
+DEFAULT_MAX_WORKERS = 4
+
+# Threads encoding preview JPEGs behind the detection loop
+PREVIEW_WRITE_WORKERS = 2
+# Previews only need to show the crop; below the default 95 encodes faster
+PREVIEW_JPEG_QUALITY = 85
+
+
+def _default_socket_path() -> Path:
+    """Per-user location for the `serve` socket.
+
+    $XDG_RUNTIME_DIR is private to the user already; otherwise the socket goes
+    in a user cache directory that `serve` creates as 0700.
+    """
+    runtime_dir = os.environ.get("XDG_RUNTIME_DIR")
+    base = Path(runtime_dir) if runtime_dir else Path.home() / ".cache" / "lightroom-subject-crop"
+    return base / "lightroom-subject-crop.sock"
+
+
+# Where `serve` listens and `process --via-daemon` connects by default
+DEFAULT_SOCKET = _default_socket_path()
+
+# Summary table color per result status
+_STATUS_COLORS = {
+    "success": "green",
+    "dry_run": "cyan",
+    "no_subject": "yellow",
+    "error": "red",
+    "skipped": "dim",
+}
+
 # Supported image extensions
 SUPPORTED_EXTENSIONS = {
     ".jpg", ".jpeg", ".png", ".tif", ".tiff",
@@ -53,26 +97,53 @@ def get_image_files(path: Path) -> list[Path]:
             console.print(f"[yellow]Unsupported file type: {path.suffix}[/yellow]")
             return []
     elif path.is_dir():
-        files = []
-        for ext in SUPPORTED_EXTENSIONS:
-            files.extend(path.glob(f"*{ext}"))
-            files.extend(path.glob(f"*{ext.upper()}"))
-        return sorted(set(files))
+        # One directory pass; suffix matching is case-insensitive
+        with os.scandir(path) as entries:
+            files = [
+                Path(entry.path)
+                for entry in entries
+                if os.path.splitext(entry.name)[1].lower() in SUPPORTED_EXTENSIONS
+                and entry.is_file()
+            ]
+        return sorted(files)
     else:
         console.print(f"[red]Path not found: {path}[/red]")
         return []
 
 
+# Background writer for draw_crop_preview, created on first use; the lock
+# keeps concurrent daemon handlers from each creating one
+_preview_writer: ThreadPoolExecutor | None = None
+_preview_writer_lock = threading.Lock()
+
+# Preview writes not yet checked, as (image path, future); see _wait_for_previews
+_pending_previews: list[tuple[Path, Future]] = []
+
+
+def _write_preview(output_path: Path, image: np.ndarray) -> None:
+    """Encode and write a preview JPEG, raising if OpenCV can't."""
+    if not cv2.imwrite(str(output_path), image, [cv2.IMWRITE_JPEG_QUALITY, PREVIEW_JPEG_QUALITY]):
+        raise OSError(f"Could not write preview: {output_path}")
+
+
 def draw_crop_preview(
     image_path: Path,
     crop: CropRegion,
     detection: Detection | None,
-    output_path: Path
-) -> None:
-    """Draw crop overlay on image and save preview."""
-    image = cv2.imread(str(image_path))
+    output_path: Path,
+    image: np.ndarray | None = None,
+) -> Future | None:
+    """Draw crop overlay on image and save preview.
+
+    Pass the already-decoded BGR image to skip reading the file again; it
+    is drawn on in place. The file is written in the background; wait on
+    the returned future, or call _wait_for_previews, before relying on it.
+    Returns None if the image can't be read.
+    """
+    if image is None:
+        image = read_image(image_path)
     if image is None:
-        return
+        return None
 
     height, width = image.shape[:2]
 
@@ -90,25 +161,273 @@ def draw_crop_preview(
             cv2.FONT_HERSHEY_SIMPLEX, 0.7, (0, 255, 0), 2
         )
 
-    # Draw crop region (blue rectangle)
+    # Crop region in pixels
     cx1 = int(crop.left * width)
     cy1 = int(crop.top * height)
     cx2 = int(crop.right * width)
     cy2 = int(crop.bottom * height)
-    cv2.rectangle(image, (cx1, cy1), (cx2, cy2), (255, 0, 0), 3)
 
-    # Darken areas outside crop
-    overlay = image.copy()
-    cv2.rectangle(overlay, (0, 0), (width, cy1), (0, 0, 0), -1)  # Top
-    cv2.rectangle(overlay, (0, cy2), (width, height), (0, 0, 0), -1)  # Bottom
-    cv2.rectangle(overlay, (0, cy1), (cx1, cy2), (0, 0, 0), -1)  # Left
-    cv2.rectangle(overlay, (cx2, cy1), (width, cy2), (0, 0, 0), -1)  # Right
-    cv2.addWeighted(overlay, 0.5, image, 0.5, 0, image)
+    # Darken areas outside crop to half brightness, in place
+    image[:cy1] >>= 1  # Top
+    image[cy2:] >>= 1  # Bottom
+    image[cy1:cy2, :cx1] >>= 1  # Left
+    image[cy1:cy2, cx2:] >>= 1  # Right
 
-    # Re-draw crop border on top
+    # Draw crop border (blue rectangle) on top
     cv2.rectangle(image, (cx1, cy1), (cx2, cy2), (255, 0, 0), 3)
 
-    cv2.imwrite(str(output_path), image)
+    # Encode and write off the calling thread; the next image can start detecting
+    global _preview_writer
+    with _preview_writer_lock:
+        if _preview_writer is None:
+            _preview_writer = ThreadPoolExecutor(max_workers=PREVIEW_WRITE_WORKERS)
+        return _preview_writer.submit(_write_preview, output_path, image)
+
+
+def _wait_for_previews() -> dict[Path, str]:
+    """Block until every tracked preview has been written.
+
+    Returns:
+        Error message per image whose preview failed
+    """
+    global _preview_writer
+    failures = {}
+    for image_path, future in _pending_previews:
+        try:
+            future.result()
+        except Exception as e:
+            failures[image_path] = str(e)
+    _pending_previews.clear()
+
+    with _preview_writer_lock:
+        if _preview_writer is not None:
+            _preview_writer.shutdown(wait=True)
+            _preview_writer = None
+    return failures
+
+
+def _cuda_available() -> bool:
+    """Whether torch can run on a CUDA GPU here."""
+    try:
+        import torch
+    except ImportError:
+        return False
+    return torch.cuda.is_available()
+
+
+# Detector owned by this process when running as a pool worker
+_worker_detector: SubjectDetector | None = None
+
+
+def _init_worker(detection_model: str) -> None:
+    """Set up a pool process with its own detector.
+
+    Each worker gets one thread for torch and OpenCV; with several workers
+    sharing the cores, nested thread pools only contend and run slower.
+    """
+    global _worker_detector
+    import torch
+
+    torch.set_num_threads(1)
+    cv2.setNumThreads(0)
+    _worker_detector = SubjectDetector(model_type=detection_model)
+
+
+def _process_one(
+    image_path: Path,
+    target_aspect: tuple[int, int],
+    padding: float,
+    detection_strategy: str,
+    output_dir: Path | None,
+    write_xmp: bool,
+    preview: bool,
+    dry_run: bool,
+    verbose: bool,
+    detector: SubjectDetector | None = None,
+    wait_for_preview: bool = False,
+) -> dict:
+    """Detect, crop and write outputs for one image.
+
+    Runs in a pool worker (using its detector) or in-process with an explicit
+    detector. Verbose messages are returned under "log" for the caller to print.
+    The preview is written in the background and checked by _wait_for_previews,
+    unless wait_for_preview is set: then it is on disk (or its error is in the
+    result) on return. Pool workers and daemon handlers must wait, since only
+    the calling process's main thread collects tracked previews.
+    """
+    log: list[str] = []
+    result = {
+        "file": image_path.name,
+        "status": "skipped",
+        "detection": None,
+        "crop": None,
+        "xmp_path": None,
+        "log": log,
+    }
+
+    try:
+        # Decode once for detection, dimensions and preview
+        image = read_image(image_path)
+        if image is None:
+            raise ValueError(f"Failed to load image: {image_path}")
+        height, width = image.shape[:2]
+
+        # Detect subjects
+        detections = (detector or _worker_detector).detect_images([image])[0]
+
+        if not detections:
+            result["status"] = "no_subject"
+            if verbose:
+                log.append("  [yellow]No subject detected[/yellow]")
+        else:
+            # Select primary subject
+            primary = select_primary_subject(detections, detection_strategy)
+            result["detection"] = primary
+
+            if verbose:
+                log.append(
+                    f"  Detected {len(detections)} subject(s), "
+                    f"primary: {primary.label} ({primary.confidence:.2f})"
+                )
+
+            # Calculate crop
+            crop = calculate_crop_for_detection(
+                primary,
+                image_width=width,
+                image_height=height,
+                target_aspect=target_aspect,
+                padding=padding
+            )
+            result["crop"] = crop
+
+            if verbose:
+                log.append(
+                    f"  Crop: L={crop.left:.3f}, R={crop.right:.3f}, "
+                    f"T={crop.top:.3f}, B={crop.bottom:.3f}"
+                )
+
+            # Write XMP
+            if write_xmp and not dry_run:
+                xmp_path, written = write_crop_to_xmp(
+                    image_path,
+                    crop,
+                    output_dir=output_dir,
+                    backup=True
+                )
+                if verbose and not written:
+                    log.append("  XMP unchanged")
+                result["xmp_path"] = xmp_path
+                result["status"] = "success"
+            elif dry_run:
+                xmp_path = get_xmp_path(image_path)
+                if output_dir:
+                    xmp_path = output_dir / xmp_path.name
+                result["xmp_path"] = xmp_path
+                result["status"] = "dry_run"
+            else:
+                result["status"] = "success"
+
+            # Generate preview
+            if preview and not dry_run:
+                preview_dir = output_dir or image_path.parent
+                preview_path = preview_dir / f"{image_path.stem}_preview.jpg"
+                preview_written = draw_crop_preview(
+                    image_path, crop, primary, preview_path, image=image
+                )
+                if preview_written is not None:
+                    if wait_for_preview:
+                        preview_written.result()
+                    else:
+                        _pending_previews.append((image_path, preview_written))
+                if verbose:
+                    log.append(f"  Preview: {preview_path}")
+
+    except Exception as e:
+        result["status"] = "error"
+        result["error"] = str(e)
+        if verbose:
+            log.append(f"  [red]Error: {e}[/red]")
+
+    return result
+
+
+def _daemon_reply(result: dict) -> dict:
+    """Reduce a _process_one result to the JSON fields the client reports on."""
+    return {
+        "file": result["file"],
+        "status": result["status"],
+        "error": result.get("error"),
+        "xmp_path": str(result["xmp_path"]) if result["xmp_path"] else None,
+        "log": result["log"],
+    }
+
+
+@dataclass
+class _DaemonConnection:
+    """Client side of a connection to a `serve` daemon."""
+
+    sock: socket.socket
+    replies: BinaryIO
+    model: str  # Detection model the daemon was started with
+
+    def close(self) -> None:
+        self.replies.close()
+        self.sock.close()
+
+
+def _connect_daemon(socket_path: Path) -> _DaemonConnection | None:
+    """Connect to a running `serve` daemon, or None if none is listening.
+
+    Only sockets owned by the current user are trusted; another user's
+    socket at the same path is treated as no daemon.
+    """
+    if not hasattr(socket, "AF_UNIX"):
+        return None
+    try:
+        st = os.stat(socket_path)
+    except OSError:
+        return None
+    if not stat.S_ISSOCK(st.st_mode) or st.st_uid != os.getuid():
+        return None
+
+    client = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        client.connect(str(socket_path))
+        replies = client.makefile("rb")
+        # The daemon greets each connection with the model it serves
+        model = json.loads(replies.readline())["model"]
+    except (OSError, ValueError, LookupError, TypeError):
+        client.close()
+        return None
+    return _DaemonConnection(client, replies, model)
+
+
+class _DaemonHandler(socketserver.StreamRequestHandler):
+    """Serves one client connection: a JSON request per line, a JSON reply per line."""
+
+    def handle(self) -> None:
+        hello = {"model": self.server.detector.model_type}
+        self.wfile.write((json.dumps(hello) + "\n").encode("utf-8"))
+        self.wfile.flush()
+
+        for line in self.rfile:
+            request = json.loads(line)
+            result = _process_one(
+                Path(request["path"]),
+                target_aspect=tuple(request["aspect"]),
+                padding=request["padding"],
+                detection_strategy=request["strategy"],
+                output_dir=Path(request["output_dir"]) if request["output_dir"] else None,
+                write_xmp=request["write_xmp"],
+                preview=request["preview"],
+                dry_run=request["dry_run"],
+                verbose=request["verbose"],
+                detector=self.server.detector,
+                # The client reports on the reply; the preview must exist by then
+                wait_for_preview=True,
+            )
+            self.wfile.write((json.dumps(_daemon_reply(result)) + "\n").encode("utf-8"))
+            self.wfile.flush()
 
 
 @app.command()
@@ -153,6 +472,18 @@ def process(
         bool,
         typer.Option("--verbose", "-v", help="Verbose output")
     ] = False,
+    workers: Annotated[
+        Optional[int],
+        typer.Option("--workers", "-w", help="Parallel worker processes for CPU inference (default: one per core, up to 4; 1 with a CUDA GPU)")
+    ] = None,
+    via_daemon: Annotated[
+        bool,
+        typer.Option("--via-daemon", help="Send images to a running `serve` daemon instead of loading models (its --model must match)")
+    ] = False,
+    socket_path: Annotated[
+        Path,
+        typer.Option("--socket", help="Socket of the `serve` daemon")
+    ] = DEFAULT_SOCKET,
 ) -> None:
     """Process images and generate XMP crop data for Lightroom."""
     # Parse aspect ratio
@@ -169,8 +500,39 @@ def process(
     console.print(f"Padding: [cyan]{padding:.0%}[/cyan]")
     console.print()
 
-    # Initialize detector
-    detector = SubjectDetector(model_type=detection_model)
+    # Parse worker count; more workers than files just load extra models.
+    # One process already keeps a GPU busy, and each extra one would need its
+    # own weights and CUDA context in VRAM.
+    if workers is None:
+        if _cuda_available():
+            workers = 1
+        else:
+            workers = min(os.cpu_count() or 1, len(image_files), DEFAULT_MAX_WORKERS)
+    workers = max(1, min(workers, len(image_files)))
+
+    process_one = partial(
+        _process_one,
+        target_aspect=target_aspect,
+        padding=padding,
+        detection_strategy=detection_strategy,
+        output_dir=output_dir,
+        write_xmp=write_xmp,
+        preview=preview,
+        dry_run=dry_run,
+        verbose=verbose,
+    )
+
+    daemon = _connect_daemon(socket_path) if via_daemon else None
+    if via_daemon and daemon is None:
+        console.print(f"[yellow]No daemon at {socket_path}; processing locally[/yellow]")
+    elif daemon is not None and daemon.model != detection_model:
+        daemon.close()
+        console.print(
+            f"[red]The daemon at {socket_path} serves the '{daemon.model}' model, "
+            f"not '{detection_model}'. Restart it with --model {detection_model} "
+            f"or drop --via-daemon.[/red]"
+        )
+        raise typer.Exit(1)
 
     # Track results
     results = []
@@ -183,95 +545,109 @@ def process(
     ) as progress:
         task = progress.add_task("Processing...", total=len(image_files))
 
-        for image_path in image_files:
-            progress.update(task, description=f"Processing {image_path.name}")
+        def report(image_path: Path, result: dict) -> None:
+            # One console write per image, header and buffered lines together
+            if result["log"]:
+                progress.console.print(
+                    "\n".join([f"[bold]{image_path.name}[/bold]", *result["log"]])
+                )
+            results.append(result)
 
-            result = {
-                "file": image_path.name,
-                "status": "skipped",
-                "detection": None,
-                "crop": None,
-                "xmp_path": None,
+        def advance(image_path: Path) -> None:
+            progress.update(task, advance=1, description=f"Processed {image_path.name}")
+
+        def record(image_path: Path, result: dict) -> None:
+            report(image_path, result)
+            advance(image_path)
+
+        if daemon is not None:
+            request = {
+                "aspect": list(target_aspect),
+                "padding": padding,
+                "strategy": detection_strategy,
+                "output_dir": str(output_dir.resolve()) if output_dir else None,
+                "write_xmp": write_xmp,
+                "preview": preview,
+                "dry_run": dry_run,
+                "verbose": verbose,
             }
-
+            # Files to process here instead: none, unless the daemon stops answering
+            pending = []
             try:
-                # Detect subjects
-                detections = detector.detect(image_path)
-
-                if not detections:
-                    result["status"] = "no_subject"
-                    if verbose:
-                        console.print(f"  [yellow]No subject detected[/yellow]")
-                else:
-                    # Select primary subject
-                    primary = select_primary_subject(detections, detection_strategy)
-                    result["detection"] = primary
-
-                    if verbose:
-                        console.print(
-                            f"  Detected {len(detections)} subject(s), "
-                            f"primary: {primary.label} ({primary.confidence:.2f})"
+                for i, image_path in enumerate(image_files):
+                    progress.update(task, description=f"Processing {image_path.name}")
+                    request["path"] = str(image_path.resolve())
+                    try:
+                        daemon.sock.sendall((json.dumps(request) + "\n").encode("utf-8"))
+                        reply = daemon.replies.readline()
+                    except OSError:
+                        reply = b""
+                    if not reply:
+                        # The daemon exited, or dropped the connection on this request
+                        progress.console.print(
+                            "[yellow]Daemon stopped responding; processing the rest locally[/yellow]"
                         )
-
-                    # Get image dimensions
-                    image = cv2.imread(str(image_path))
-                    if image is None:
-                        result["status"] = "error"
-                        result["error"] = "Failed to load image"
-                    else:
-                        height, width = image.shape[:2]
-
-                        # Calculate crop
-                        crop = calculate_crop_for_detection(
-                            primary,
-                            image_width=width,
-                            image_height=height,
-                            target_aspect=target_aspect,
-                            padding=padding
-                        )
-                        result["crop"] = crop
-
-                        if verbose:
-                            console.print(
-                                f"  Crop: L={crop.left:.3f}, R={crop.right:.3f}, "
-                                f"T={crop.top:.3f}, B={crop.bottom:.3f}"
-                            )
-
-                        # Write XMP
-                        if write_xmp and not dry_run:
-                            xmp_path = write_crop_to_xmp(
-                                image_path,
-                                crop,
-                                output_dir=output_dir,
-                                backup=True
-                            )
-                            result["xmp_path"] = xmp_path
-                            result["status"] = "success"
-                        elif dry_run:
-                            xmp_path = get_xmp_path(image_path)
-                            if output_dir:
-                                xmp_path = output_dir / xmp_path.name
-                            result["xmp_path"] = xmp_path
-                            result["status"] = "dry_run"
-                        else:
-                            result["status"] = "success"
-
-                        # Generate preview
-                        if preview and not dry_run:
-                            preview_dir = output_dir or image_path.parent
-                            preview_path = preview_dir / f"{image_path.stem}_preview.jpg"
-                            draw_crop_preview(image_path, crop, primary, preview_path)
-                            if verbose:
-                                console.print(f"  Preview: {preview_path}")
-
-            except Exception as e:
-                result["status"] = "error"
-                result["error"] = str(e)
-                if verbose:
-                    console.print(f"  [red]Error: {e}[/red]")
-
-            results.append(result)
-            progress.update(task, advance=1)
+                        pending = image_files[i:]
+                        break
+                    record(image_path, json.loads(reply))
+            finally:
+                daemon.close()
+        else:
+            pending = image_files
+
+        if pending and workers == 1:
+            detector = SubjectDetector(model_type=detection_model)
+            for image_path in pending:
+                progress.update(task, description=f"Processing {image_path.name}")
+                record(image_path, process_one(image_path, detector=detector))
+        elif pending:
+            with ProcessPoolExecutor(
+                max_workers=workers,
+                initializer=_init_worker,
+                initargs=(detection_model,),
+            ) as executor:
+                futures = {
+                    executor.submit(process_one, image_path, wait_for_preview=True): i
+                    for i, image_path in enumerate(pending)
+                }
+                # Progress follows completion, but logs are reported in file
+                # order: finished results wait here until those before them are in
+                finished: dict[int, dict] = {}
+                next_to_report = 0
+                for future in as_completed(futures):
+                    i = futures[future]
+                    image_path = pending[i]
+                    try:
+                        result = future.result()
+                    except Exception as e:
+                        # _process_one catches its own errors; this is the pool
+                        # failing, e.g. a crashed worker (BrokenProcessPool) or
+                        # a result that couldn't be pickled back
+                        result = {
+                            "file": image_path.name,
+                            "status": "error",
+                            "detection": None,
+                            "crop": None,
+                            "xmp_path": None,
+                            "error": str(e) or type(e).__name__,
+                            "log": [f"  [red]Error: {e!r}[/red]"] if verbose else [],
+                        }
+                    advance(image_path)
+
+                    finished[i] = result
+                    while next_to_report in finished:
+                        report(pending[next_to_report], finished.pop(next_to_report))
+                        next_to_report += 1
+
+    # Previews written in the background count against their image's result
+    preview_failures = _wait_for_previews()
+    if preview_failures:
+        by_file = {r["file"]: r for r in results}
+        for image_path, error in preview_failures.items():
+            console.print(f"[red]{image_path.name}: preview failed: {error}[/red]")
+            result = by_file[image_path.name]
+            result["status"] = "error"
+            result["error"] = error
 
     # Print summary
     console.print()
@@ -281,19 +657,10 @@ def process(
     table.add_column("Status")
     table.add_column("Count")
 
-    status_counts = {}
-    for r in results:
-        status = r["status"]
-        status_counts[status] = status_counts.get(status, 0) + 1
+    status_counts = Counter(r["status"] for r in results)
 
     for status, count in sorted(status_counts.items()):
-        color = {
-            "success": "green",
-            "dry_run": "cyan",
-            "no_subject": "yellow",
-            "error": "red",
-            "skipped": "dim",
-        }.get(status, "white")
+        color = _STATUS_COLORS.get(status, "white")
         table.add_row(f"[{color}]{status}[/{color}]", str(count))
 
     console.print(table)
@@ -302,6 +669,62 @@ def process(
         console.print("\n[cyan]Dry run complete. No files were written.[/cyan]")
 
 
+@app.command()
+def serve(
+    detection_model: Annotated[
+        str,
+        typer.Option("--model", "-m", help="Detection model: yolo or face")
+    ] = "yolo",
+    socket_path: Annotated[
+        Path,
+        typer.Option("--socket", help="Unix socket to listen on")
+    ] = DEFAULT_SOCKET,
+) -> None:
+    """Keep the detector loaded and serve `process --via-daemon` requests."""
+    if not hasattr(socketserver, "ThreadingUnixStreamServer"):
+        console.print("[red]serve needs Unix domain sockets, which this platform lacks.[/red]")
+        raise typer.Exit(1)
+
+    # Never take over the socket of a daemon that is still running
+    running = _connect_daemon(socket_path)
+    if running is not None:
+        running.close()
+        console.print(f"[red]A daemon is already serving on {socket_path}.[/red]")
+        raise typer.Exit(1)
+
+    if socket_path.parent == DEFAULT_SOCKET.parent:
+        socket_path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+        socket_path.parent.chmod(0o700)
+
+    detector = SubjectDetector(model_type=detection_model)
+    detector.load_models()
+
+    # A socket left by a daemon that didn't shut down cleanly blocks bind()
+    if socket_path.is_socket():
+        if socket_path.stat().st_uid != os.getuid():
+            console.print(f"[red]{socket_path} belongs to another user; pass a different --socket.[/red]")
+            raise typer.Exit(1)
+        socket_path.unlink()
+
+    # Bind with the socket readable and writable by its owner only (0600)
+    old_umask = os.umask(0o177)
+    try:
+        server = socketserver.ThreadingUnixStreamServer(str(socket_path), _DaemonHandler)
+    finally:
+        os.umask(old_umask)
+
+    with server:
+        server.daemon_threads = True
+        server.detector = detector
+        console.print(f"Serving on [cyan]{socket_path}[/cyan] (Ctrl+C to stop)")
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            socket_path.unlink(missing_ok=True)
+
+
 @app.command()
 def version():
     """Show version information."""
@@ -14,30 +14,35 @@ class SubjectStrategy(Enum):
     @classmethod
     def display_name(cls, strategy: "SubjectStrategy") -> str:
         """Get the display name for a strategy."""
-        names = {
-            cls.SMART_SELECT: "Smart Select",
-            cls.MAIN_SUBJECT: "Main Subject",
-            cls.CENTER_STAGE: "Center Stage",
-        }
-        return names.get(strategy, strategy.name)
+        return _STRATEGY_DISPLAY_NAMES.get(strategy, strategy.name)
 
     @classmethod
     def description(cls, strategy: "SubjectStrategy") -> str:
         """Get the description for a strategy."""
-        descriptions = {
-            cls.SMART_SELECT: "AI picks the best subject automatically",
-            cls.MAIN_SUBJECT: "Focuses on the largest person in frame",
-            cls.CENTER_STAGE: "Prioritizes whoever's most centered",
-        }
-        return descriptions.get(strategy, "")
+        return _STRATEGY_DESCRIPTIONS.get(strategy, "")
 
     @classmethod
     def from_display_name(cls, name: str) -> "SubjectStrategy":
         """Get strategy from display name."""
-        for strategy in cls:
-            if cls.display_name(strategy) == name:
-                return strategy
-        return cls.SMART_SELECT
+        return _STRATEGIES_BY_DISPLAY_NAME.get(name, cls.SMART_SELECT)
+
+
+# Built after the enum body since members can't be referenced inside it
+_STRATEGY_DISPLAY_NAMES: dict[SubjectStrategy, str] = {
+    SubjectStrategy.SMART_SELECT: "Smart Select",
+    SubjectStrategy.MAIN_SUBJECT: "Main Subject",
+    SubjectStrategy.CENTER_STAGE: "Center Stage",
+}
+
+_STRATEGY_DESCRIPTIONS: dict[SubjectStrategy, str] = {
+    SubjectStrategy.SMART_SELECT: "AI picks the best subject automatically",
+    SubjectStrategy.MAIN_SUBJECT: "Focuses on the largest person in frame",
+    SubjectStrategy.CENTER_STAGE: "Prioritizes whoever's most centered",
+}
+
+_STRATEGIES_BY_DISPLAY_NAME: dict[str, SubjectStrategy] = {
+    SubjectStrategy.display_name(s): s for s in SubjectStrategy
+}
 
 
 @dataclass
@@ -160,20 +165,19 @@ def get_destination_names() -> list[str]:
     return [preset.name for preset in DESTINATIONS.values()]
 
 
+# Display-name indexes for the lookups below
+_SHOOT_TYPES_BY_NAME: dict[str, ShootTypePreset] = {p.name: p for p in SHOOT_TYPES.values()}
+_DESTINATIONS_BY_NAME: dict[str, DestinationPreset] = {p.name: p for p in DESTINATIONS.values()}
+
+
 def get_shoot_type_by_name(name: str) -> ShootTypePreset | None:
     """Get shoot type preset by display name."""
-    for preset in SHOOT_TYPES.values():
-        if preset.name == name:
-            return preset
-    return None
+    return _SHOOT_TYPES_BY_NAME.get(name)
 
 
 def get_destination_by_name(name: str) -> DestinationPreset | None:
     """Get destination preset by display name."""
-    for preset in DESTINATIONS.values():
-        if preset.name == name:
-            return preset
-    return None
+    return _DESTINATIONS_BY_NAME.get(name)
 
 
 def get_strategy_names() -> list[str]:
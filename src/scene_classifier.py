@@ -1,14 +1,35 @@
 """Scene classification using CLIP for auto-detecting shoot type."""
 
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Callable
 
+import numpy as np
 import torch
 from PIL import Image
 from transformers import CLIPModel, CLIPProcessor
 
 from .presets import SHOOT_TYPES, ShootTypePreset
 
+# Shortest side CLIP ViT-B/32 resizes its input to
+CLIP_INPUT_SIZE = 224
+
+# Images classify_batch samples, and how many it scores before deciding
+# whether the rest are needed
+MAX_SAMPLES = 5
+FIRST_SAMPLES = 2
+
+# classify_batch stops after the first samples once one category averages above this
+CONFIDENT_SCORE = 0.8
+
+# Batch sizes classify_image and classify_batch score: one image, the first
+# samples, or the remaining ones
+SCORED_BATCH_SIZES = tuple(range(1, max(FIRST_SAMPLES, MAX_SAMPLES - FIRST_SAMPLES) + 1))
+
+# Grayscale std dev at 32x32 below which a sample is too flat to tell scenes apart
+FLAT_FRAME_STDDEV = 8.0
+
 
 class SceneClassifier:
     """Classifies photography scenes using CLIP zero-shot classification."""
@@ -49,15 +70,99 @@ class SceneClassifier:
         """Initialize the classifier. Model loaded lazily on first use."""
         self._model: CLIPModel | None = None
         self._processor: CLIPProcessor | None = None
-        self._device = "cuda" if torch.cuda.is_available() else "cpu"
+        self._text_features: torch.Tensor | None = None
+        self._logit_scale: float = 100.0
+        # Serializes loading; _model is only set once everything it needs is ready
+        self._load_lock = threading.Lock()
+
+        # Prompt order and each category's prompt positions are fixed by SCENE_PROMPTS
+        self._categories = list(self.SCENE_PROMPTS)
+        self._all_prompts = [p for prompts in self.SCENE_PROMPTS.values() for p in prompts]
+        cat_ids = np.array(
+            [i for i, prompts in enumerate(self.SCENE_PROMPTS.values()) for _ in prompts]
+        )
+        # probs @ one-hot sums each category's prompts in a single matmul
+        self._cat_onehot = np.eye(len(self._categories), dtype=np.float32)[cat_ids]
+        self._cat_counts = np.bincount(cat_ids, minlength=len(self._categories))
+
+        if torch.cuda.is_available():
+            self._device = "cuda"
+        elif torch.backends.mps.is_available():
+            self._device = "mps"
+        else:
+            self._device = "cpu"
+        # Half precision on GPU/MPS; CPU kernels for FP16 are slow or missing
+        self._dtype = torch.float16 if self._device != "cpu" else torch.float32
 
     def _load_model(self):
-        """Load CLIP model if not already loaded."""
-        if self._model is None:
-            self._model = CLIPModel.from_pretrained("openai/clip-vit-base-patch32")
+        """Load CLIP model if not already loaded.
+
+        Concurrent callers wait for a single load. The model is published
+        only after the processor, prompt embeddings and any compile/warm-up
+        are in place, so a caller that sees it can score straight away, and
+        a failed load leaves it unset to be retried.
+        """
+        if self._model is not None:
+            return
+        with self._load_lock:
+            if self._model is not None:
+                return
+            model = CLIPModel.from_pretrained("openai/clip-vit-base-patch32")
             self._processor = CLIPProcessor.from_pretrained("openai/clip-vit-base-patch32")
-            self._model.to(self._device)
-            self._model.eval()
+            model.to(self._device, dtype=self._dtype)
+            model.eval()
+            self._encode_prompts(model)
+            if self._device == "cuda":
+                self._compile_vision_model(model)
+            self._model = model
+
+    def _encode_prompts(self, model: CLIPModel):
+        """Embed all scene prompts once and drop the text tower.
+
+        The prompts are fixed, so their embeddings never change. Once cached,
+        only the vision tower is needed per image, freeing the text weights.
+        """
+        text_inputs = self._processor(text=self._all_prompts, return_tensors="pt", padding=True)
+        text_inputs = {k: v.to(self._device) for k, v in text_inputs.items()}
+
+        with torch.inference_mode():
+            text_features = model.get_text_features(**text_inputs).float()
+            self._text_features = text_features / text_features.norm(dim=-1, keepdim=True)
+            self._logit_scale = float(model.logit_scale.exp())
+
+        del model.text_model
+        del model.text_projection
+
+    def _compile_vision_model(self, model: CLIPModel):
+        """Compile the vision tower with CUDA graphs, falling back to eager.
+
+        Compilation happens lazily on the first forward pass, so the warm-up
+        runs here too; if no compiler backend is available (e.g. Triton
+        missing) that pass fails and the eager tower is restored.
+        """
+        eager = model.vision_model
+        try:
+            model.vision_model = torch.compile(eager, mode="reduce-overhead")
+            self._warm_up(model)
+        except Exception:
+            model.vision_model = eager
+            self._warm_up(model)
+
+    def _warm_up(self, model: CLIPModel):
+        """Run throwaway forward passes at each scored batch size.
+
+        cuDNN algorithm selection (benchmark mode), compiled graphs and CUDA
+        graph recording are all per input shape, and images are always
+        224x224, so a shape is just a batch size. Warming up every size in
+        SCORED_BATCH_SIZES means no real batch pays that setup. Each size
+        runs three times, because CUDA graphs are recorded on a later pass
+        than the first.
+        """
+        torch.backends.cudnn.benchmark = True
+        dummy = Image.new("RGB", (CLIP_INPUT_SIZE, CLIP_INPUT_SIZE))
+        for batch_size in SCORED_BATCH_SIZES:
+            for _ in range(3):
+                self._score_images([dummy] * batch_size, model)
 
     def classify_image(self, image_path: Path) -> tuple[str, float, dict[str, float]]:
         """Classify a single image.
@@ -76,44 +181,8 @@ class SceneClassifier:
         # Load and preprocess image
         image = Image.open(image_path).convert("RGB")
 
-        # Build all text prompts
-        all_prompts = []
-        prompt_to_category = {}
-        for category, prompts in self.SCENE_PROMPTS.items():
-            for prompt in prompts:
-                all_prompts.append(prompt)
-                prompt_to_category[prompt] = category
-
-        # Get CLIP embeddings
-        inputs = self._processor(
-            text=all_prompts,
-            images=image,
-            return_tensors="pt",
-            padding=True,
-        )
-        inputs = {k: v.to(self._device) for k, v in inputs.items()}
-
-        with torch.no_grad():
-            outputs = self._model(**inputs)
-            logits_per_image = outputs.logits_per_image
-            probs = logits_per_image.softmax(dim=1).cpu().numpy()[0]
-
-        # Aggregate scores by category (average of all prompts for that category)
-        category_scores: dict[str, list[float]] = {cat: [] for cat in self.SCENE_PROMPTS}
-        for prompt, prob in zip(all_prompts, probs):
-            category = prompt_to_category[prompt]
-            category_scores[category].append(float(prob))
-
-        # Average scores per category
-        final_scores = {
-            cat: sum(scores) / len(scores)
-            for cat, scores in category_scores.items()
-        }
-
-        # Normalize to sum to 1
-        total = sum(final_scores.values())
-        if total > 0:
-            final_scores = {k: v / total for k, v in final_scores.items()}
+        probs = self._score_images([image])[0]
+        final_scores = self._category_scores(probs)
 
         # Find best match
         best_category = max(final_scores, key=final_scores.get)
@@ -121,24 +190,95 @@ class SceneClassifier:
 
         return best_category, best_confidence, final_scores
 
+    def _score_images(self, images: list[Image.Image], model: CLIPModel | None = None) -> np.ndarray:
+        """Run CLIP on a batch of images against the cached prompt embeddings.
+
+        Args:
+            images: RGB images, inferred in a single forward pass
+            model: Model to run; defaults to the loaded one (set while loading)
+
+        Returns:
+            Array of shape (len(images), num_prompts) with per-image prompt
+            probabilities
+        """
+        if model is None:
+            model = self._model
+        inputs = self._processor(images=images, return_tensors="pt")
+        pixel_values = inputs["pixel_values"].to(self._device, dtype=self._dtype)
+
+        with torch.inference_mode():
+            image_features = model.get_image_features(pixel_values=pixel_values).float()
+            image_features = image_features / image_features.norm(dim=-1, keepdim=True)
+            logits_per_image = self._logit_scale * image_features @ self._text_features.T
+            return logits_per_image.softmax(dim=1).cpu().numpy()
+
+    def _category_scores(self, probs: np.ndarray) -> dict[str, float]:
+        """Average one image's prompt probabilities per category, normalized to sum to 1."""
+        means = self._category_means(probs[np.newaxis])[0]
+        return dict(zip(self._categories, means.tolist()))
+
+    def _category_means(self, probs: np.ndarray) -> np.ndarray:
+        """Average (N, P) prompt probabilities into (N, C) per-category scores.
+
+        Each row is normalized to sum to 1.
+        """
+        means = (probs @ self._cat_onehot) / self._cat_counts
+        totals = means.sum(axis=1, keepdims=True)
+        return np.divide(means, totals, out=means, where=totals > 0)
+
+    @staticmethod
+    def _load_sample(path: Path) -> Image.Image | None:
+        """Decode a sample image small enough for CLIP, or None if unreadable."""
+        try:
+            image = Image.open(path)
+            # JPEG only: decode at a reduced DCT scale that still covers CLIP's input
+            image.draft("RGB", (CLIP_INPUT_SIZE, CLIP_INPUT_SIZE))
+            return image.convert("RGB")
+        except Exception:
+            return None  # Skip problematic images
+
+    @staticmethod
+    def _is_flat(image: Image.Image) -> bool:
+        """Whether a sample has almost no tonal variation at thumbnail scale."""
+        thumb = image.convert("L").resize((32, 32))
+        return float(np.asarray(thumb).std()) < FLAT_FRAME_STDDEV
+
+    def _score_each(self, images: list[Image.Image]) -> np.ndarray:
+        """Category scores for each image scored on its own, skipping failures.
+
+        Returns:
+            Array of shape (number scored, num_categories)
+        """
+        rows = []
+        for image in images:
+            try:
+                rows.append(self._category_means(self._score_images([image]))[0])
+            except Exception:
+                continue  # Skip problematic images
+        return np.array(rows).reshape(len(rows), len(self._categories))
+
     def classify_batch(
         self,
         image_paths: list[Path],
         on_progress: Callable[[int, int], None] | None = None,
+        is_cancelled: Callable[[], bool] | None = None,
     ) -> tuple[str, float, dict[str, float]]:
         """Classify multiple images and return aggregate result.
 
-        Analyzes up to 5 images for efficiency, returns the most common classification.
+        Analyzes up to 5 images for efficiency. Near-uniform frames are left out
+        unless every sample is one, and samples after the first two are only
+        scored when those two don't already point clearly to one category.
 
         Args:
             image_paths: List of image paths
             on_progress: Optional progress callback(current, total)
+            is_cancelled: Optional check polled before each image; stops early when True
 
         Returns:
             Tuple of (best_match_key, confidence, all_scores)
         """
-        # Sample up to 5 images for efficiency
-        sample_size = min(5, len(image_paths))
+        # Sample up to MAX_SAMPLES images for efficiency
+        sample_size = min(MAX_SAMPLES, len(image_paths))
         if len(image_paths) > sample_size:
             # Take evenly spaced samples
             step = len(image_paths) // sample_size
@@ -146,36 +286,54 @@ class SceneClassifier:
         else:
             samples = image_paths
 
-        # Aggregate scores across all samples
-        aggregate_scores: dict[str, list[float]] = {cat: [] for cat in self.SCENE_PROMPTS}
+        images = []
+        model_ready = True
+        # Decode samples on threads (PIL releases the GIL) while the model loads
+        with ThreadPoolExecutor(max_workers=len(samples) or 1) as executor:
+            futures = [executor.submit(self._load_sample, path) for path in samples]
+            try:
+                self._load_model()
+            except Exception:
+                model_ready = False
+
+            for i, future in enumerate(futures):
+                if is_cancelled and is_cancelled():
+                    executor.shutdown(wait=False, cancel_futures=True)
+                    break
+                if on_progress:
+                    on_progress(i, len(samples))
 
-        for i, path in enumerate(samples):
-            if on_progress:
-                on_progress(i, len(samples))
+                image = future.result()
+                if image is not None:
+                    images.append(image)
+
+        # Aggregate scores across all samples; stays empty if none could be scored
+        final_scores = {}
 
+        if images and model_ready and not (is_cancelled and is_cancelled()):
+            # Flat frames (lens cap, blank sky) say little about the scene
+            images = [image for image in images if not self._is_flat(image)] or images
             try:
-                _, _, scores = self.classify_image(path)
-                for cat, score in scores.items():
-                    aggregate_scores[cat].append(score)
+                # Score two samples first; the rest only if they leave it unclear
+                means = self._category_means(self._score_images(images[:FIRST_SAMPLES]))
+                if len(images) > FIRST_SAMPLES and means.mean(axis=0).max() <= CONFIDENT_SCORE:
+                    rest = self._category_means(self._score_images(images[FIRST_SAMPLES:]))
+                    means = np.concatenate([means, rest])
             except Exception:
-                continue  # Skip problematic images
+                # Score one at a time so a bad sample only drops itself
+                means = self._score_each(images)
+
+            if len(means):
+                # Average across all scored samples, then normalize
+                means = means.mean(axis=0)
+                total = means.sum()
+                if total > 0:
+                    means /= total
+                final_scores = dict(zip(self._categories, means.tolist()))
 
         if on_progress:
             on_progress(len(samples), len(samples))
 
-        # Average across all samples
-        final_scores = {}
-        for cat, scores in aggregate_scores.items():
-            if scores:
-                final_scores[cat] = sum(scores) / len(scores)
-            else:
-                final_scores[cat] = 0.0
-
-        # Normalize
-        total = sum(final_scores.values())
-        if total > 0:
-            final_scores = {k: v / total for k, v in final_scores.items()}
-
         # Find best match
         if final_scores:
             best_category = max(final_scores, key=final_scores.get)
@@ -207,17 +365,19 @@ def get_classifier() -> SceneClassifier:
 def auto_detect_shoot_type(
     image_paths: list[Path],
     on_progress: Callable[[int, int], None] | None = None,
+    is_cancelled: Callable[[], bool] | None = None,
 ) -> tuple[str, ShootTypePreset, float, dict[str, float]]:
     """Auto-detect shoot type from a list of images.
 
     Args:
         image_paths: List of image paths to analyze
         on_progress: Optional progress callback
+        is_cancelled: Optional check polled between images to abandon early
 
     Returns:
         Tuple of (category_key, preset, confidence, all_scores)
     """
     classifier = get_classifier()
-    category_key, confidence, scores = classifier.classify_batch(image_paths, on_progress)
+    category_key, confidence, scores = classifier.classify_batch(image_paths, on_progress, is_cancelled)
     preset = SHOOT_TYPES[category_key]
     return category_key, preset, confidence, scores
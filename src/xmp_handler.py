@@ -1,7 +1,14 @@
 """XMP sidecar file handler for Lightroom crop data."""
 
+import os
+import re
 import shutil
+import stat
+import tempfile
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
+from typing import Iterator
 
 from lxml import etree
 
@@ -18,8 +25,26 @@ NAMESPACES = {
     "photoshop": "http://ns.adobe.com/photoshop/1.0/",
 }
 
-# XMP template for new sidecar files
-XMP_TEMPLATE = """<?xpacket begin="\ufeff" id="W5M0MpCehiHzreSzNTczkc9d"?>
+# Clark-notation tag of rdf:Description, for Element.iter()
+_RDF_DESCRIPTION = "{" + NAMESPACES["rdf"] + "}Description"
+
+# Namespace-qualified crs attribute keys, built once
+_CRS_PREFIX = "{" + NAMESPACES["crs"] + "}"
+_CRS_VERSION = _CRS_PREFIX + "Version"
+_CRS_HAS_CROP = _CRS_PREFIX + "HasCrop"
+_CRS_CROP_TOP = _CRS_PREFIX + "CropTop"
+_CRS_CROP_LEFT = _CRS_PREFIX + "CropLeft"
+_CRS_CROP_BOTTOM = _CRS_PREFIX + "CropBottom"
+_CRS_CROP_RIGHT = _CRS_PREFIX + "CropRight"
+_CRS_CROP_ANGLE = _CRS_PREFIX + "CropAngle"
+
+# crs:Key="value" crop attributes, for updating a sidecar without parsing it
+_CROP_ATTR_RE = re.compile(
+    rb'\bcrs:(HasCrop|CropTop|CropLeft|CropBottom|CropRight|CropAngle)="[^"]*"'
+)
+
+# XMP for new sidecar files, pre-encoded so a new file is one bytes % format
+_XMP_TEMPLATE = """<?xpacket begin="\ufeff" id="W5M0MpCehiHzreSzNTczkc9d"?>
 <x:xmpmeta xmlns:x="adobe:ns:meta/" x:xmptk="Lightroom Subject Crop">
   <rdf:RDF xmlns:rdf="http://www.w3.org/1999/02/22-rdf-syntax-ns#">
     <rdf:Description rdf:about=""
@@ -27,16 +52,39 @@ XMP_TEMPLATE = """<?xpacket begin="\ufeff" id="W5M0MpCehiHzreSzNTczkc9d"?>
       crs:Version="15.0"
       crs:ProcessVersion="11.0"
       crs:HasCrop="True"
-      crs:CropTop="{crop_top}"
-      crs:CropLeft="{crop_left}"
-      crs:CropBottom="{crop_bottom}"
-      crs:CropRight="{crop_right}"
+      crs:CropTop="%.6f"
+      crs:CropLeft="%.6f"
+      crs:CropBottom="%.6f"
+      crs:CropRight="%.6f"
       crs:CropAngle="0"
       crs:CropConstrainToWarp="0">
     </rdf:Description>
   </rdf:RDF>
 </x:xmpmeta>
-<?xpacket end="w"?>"""
+<?xpacket end="w"?>""".encode("utf-8")
+
+# xpacket wrapper for re-serialized sidecars
+_XPACKET_BEGIN = '<?xpacket begin="\ufeff" id="W5M0MpCehiHzreSzNTczkc9d"?>\n'.encode("utf-8")
+_XPACKET_END = b'\n<?xpacket end="w"?>'
+
+# Mode for new sidecars, as open() would create them. The umask can only be
+# read by setting it, which isn't safe once writer threads are running.
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+_NEW_FILE_MODE = 0o666 & ~_UMASK
+
+# Parsers are reused per thread: construction isn't free, and one parser
+# can't be used by two threads at once
+_parser_local = threading.local()
+
+
+def _xmp_parser() -> etree.XMLParser:
+    """This thread's XMP parser. xml:id collection is off; XMP doesn't use it."""
+    parser = getattr(_parser_local, "parser", None)
+    if parser is None:
+        parser = etree.XMLParser(remove_blank_text=True, collect_ids=False)
+        _parser_local.parser = parser
+    return parser
 
 
 def get_xmp_path(image_path: str | Path) -> Path:
@@ -48,8 +96,12 @@ def get_xmp_path(image_path: str | Path) -> Path:
     Returns:
         Path to the XMP sidecar file (same name with .xmp extension)
     """
-    image_path = Path(image_path)
-    return image_path.with_suffix(image_path.suffix + ".xmp")
+    return Path(_xmp_path_str(image_path))
+
+
+def _xmp_path_str(image_path: str | Path) -> str:
+    """Sidecar path as a plain string, for internal file operations."""
+    return os.fspath(image_path) + ".xmp"
 
 
 def read_xmp(xmp_path: str | Path) -> etree._Element | None:
@@ -61,16 +113,11 @@ def read_xmp(xmp_path: str | Path) -> etree._Element | None:
     Returns:
         Parsed XML element tree or None if file doesn't exist
     """
-    xmp_path = Path(xmp_path)
-    if not xmp_path.exists():
+    if not os.path.exists(xmp_path):
         return None
 
-    with open(xmp_path, "rb") as f:
-        content = f.read()
-
-    # Parse the XMP content
-    parser = etree.XMLParser(remove_blank_text=True)
-    return etree.fromstring(content, parser)
+    # Let libxml2 read the file itself rather than via a Python bytes copy
+    return etree.parse(os.fspath(xmp_path), _xmp_parser()).getroot()
 
 
 def create_xmp_from_template(crop: CropRegion) -> str:
@@ -82,12 +129,17 @@ def create_xmp_from_template(crop: CropRegion) -> str:
     Returns:
         XMP file content as string
     """
-    return XMP_TEMPLATE.format(
-        crop_top=f"{crop.top:.6f}",
-        crop_left=f"{crop.left:.6f}",
-        crop_bottom=f"{crop.bottom:.6f}",
-        crop_right=f"{crop.right:.6f}"
-    )
+    return _create_xmp_bytes(crop).decode("utf-8")
+
+
+def _create_xmp_bytes(crop: CropRegion) -> bytes:
+    """New XMP file content, formatted straight into the encoded template."""
+    return _XMP_TEMPLATE % (crop.top, crop.left, crop.bottom, crop.right)
+
+
+def _format_crop(crop: CropRegion) -> tuple[str, str, str, str]:
+    """Crop edges as XMP attribute values: (top, left, bottom, right)."""
+    return f"{crop.top:.6f}", f"{crop.left:.6f}", f"{crop.bottom:.6f}", f"{crop.right:.6f}"
 
 
 def update_xmp_crop(root: etree._Element, crop: CropRegion) -> etree._Element:
@@ -101,23 +153,18 @@ def update_xmp_crop(root: etree._Element, crop: CropRegion) -> etree._Element:
         Updated XML element tree
     """
     # Find the rdf:Description element with crs namespace attributes
-    descriptions = root.xpath(
-        "//rdf:Description",
-        namespaces=NAMESPACES
-    )
+    descriptions = list(root.iter(_RDF_DESCRIPTION))
 
     if not descriptions:
         raise ValueError("No rdf:Description element found in XMP")
 
     # Find or create the description with Camera Raw settings
+    # Camera Raw always writes crs:Version, and we always write crs:HasCrop,
+    # so either marks the description holding crs settings
     crs_desc = None
     for desc in descriptions:
-        # Check if this description has any crs attributes
-        for attr in desc.attrib:
-            if attr.startswith("{" + NAMESPACES["crs"] + "}"):
-                crs_desc = desc
-                break
-        if crs_desc is not None:
+        if desc.get(_CRS_VERSION) is not None or desc.get(_CRS_HAS_CROP) is not None:
+            crs_desc = desc
             break
 
     if crs_desc is None:
@@ -127,28 +174,77 @@ def update_xmp_crop(root: etree._Element, crop: CropRegion) -> etree._Element:
         etree.register_namespace("crs", NAMESPACES["crs"])
 
     # Update crop attributes
-    crs_ns = "{" + NAMESPACES["crs"] + "}"
-
-    crs_desc.set(crs_ns + "HasCrop", "True")
-    crs_desc.set(crs_ns + "CropTop", f"{crop.top:.6f}")
-    crs_desc.set(crs_ns + "CropLeft", f"{crop.left:.6f}")
-    crs_desc.set(crs_ns + "CropBottom", f"{crop.bottom:.6f}")
-    crs_desc.set(crs_ns + "CropRight", f"{crop.right:.6f}")
-    crs_desc.set(crs_ns + "CropAngle", "0")
+    crs_desc.set(_CRS_HAS_CROP, "True")
+    top, left, bottom, right = _format_crop(crop)
+    crs_desc.set(_CRS_CROP_TOP, top)
+    crs_desc.set(_CRS_CROP_LEFT, left)
+    crs_desc.set(_CRS_CROP_BOTTOM, bottom)
+    crs_desc.set(_CRS_CROP_RIGHT, right)
+    crs_desc.set(_CRS_CROP_ANGLE, "0")
 
     return root
 
 
+def _replace_crop_attributes(content: bytes, crop: CropRegion) -> bytes | None:
+    """Rewrite the crop attributes of raw XMP bytes in place.
+
+    Args:
+        content: Existing XMP file content
+        crop: CropRegion with new crop coordinates
+
+    Returns:
+        Updated content, or None unless each crop attribute appears exactly
+        once (the caller then has to parse the XMP)
+    """
+    top, left, bottom, right = (value.encode("ascii") for value in _format_crop(crop))
+    values = {
+        b"HasCrop": b"True",
+        b"CropTop": top,
+        b"CropLeft": left,
+        b"CropBottom": bottom,
+        b"CropRight": right,
+        b"CropAngle": b"0",
+    }
+    seen = set()
+
+    def substitute(match: re.Match) -> bytes:
+        key = match.group(1)
+        seen.add(key)
+        return b"crs:" + key + b'="' + values[key] + b'"'
+
+    updated, count = _CROP_ATTR_RE.subn(substitute, content)
+    if count != len(values) or len(seen) != len(values):
+        return None
+    return updated
+
+
+def _update_xmp_content(content: bytes, crop: CropRegion) -> bytes:
+    """Parse existing XMP, set its crop, and serialize it again."""
+    updated_xmp = update_xmp_crop(etree.fromstring(content, _xmp_parser()), crop)
+    # No XML declaration: it may only start the document, and the
+    # xpacket header has to come first. Not pretty-printed; Lightroom
+    # doesn't need the whitespace.
+    xmp_bytes = etree.tostring(updated_xmp, encoding="utf-8", xml_declaration=False)
+
+    # Serializing the root element never includes the xpacket instructions
+    # around it, so always wrap
+    return _XPACKET_BEGIN + xmp_bytes + _XPACKET_END
+
+
 def write_crop_to_xmp(
     image_path: str | Path,
     crop: CropRegion,
     output_dir: str | Path | None = None,
     backup: bool = True
-) -> Path:
+) -> tuple[Path, bool]:
     """Write crop data to an XMP sidecar file.
 
     If an XMP file already exists, it will be updated with new crop values
-    while preserving other metadata. Otherwise, a new XMP file is created.
+    while preserving other metadata; when it already carries each crop
+    attribute once, they are replaced as text without re-serializing the
+    file. Otherwise, a new XMP file is created.
+    A target that already holds exactly the new content is left untouched
+    and not backed up.
 
     Args:
         image_path: Path to the image file
@@ -157,57 +253,166 @@ def write_crop_to_xmp(
         backup: Whether to create backup of existing XMP files
 
     Returns:
-        Path to the written XMP file
+        Tuple of (xmp_path, written); written is False when the sidecar
+        already held the crop and was left untouched
     """
-    image_path = Path(image_path)
+    # Plain string paths: this runs per image, and pathlib objects cost more
+    existing_xmp_path = _xmp_path_str(image_path)
 
     # Determine output XMP path
     if output_dir is not None:
-        output_dir = Path(output_dir)
-        output_dir.mkdir(parents=True, exist_ok=True)
-        xmp_filename = image_path.stem + image_path.suffix + ".xmp"
-        xmp_path = output_dir / xmp_filename
+        os.makedirs(output_dir, exist_ok=True)
+        xmp_path = os.path.join(output_dir, os.path.basename(existing_xmp_path))
     else:
-        xmp_path = get_xmp_path(image_path)
-
-    # Check for existing XMP file (in original location)
-    existing_xmp_path = get_xmp_path(image_path)
-    existing_xmp = None
-    if existing_xmp_path.exists():
-        existing_xmp = read_xmp(existing_xmp_path)
+        xmp_path = existing_xmp_path
 
-        # Create backup if requested
-        if backup:
-            backup_path = existing_xmp_path.with_suffix(".xmp.bak")
-            shutil.copy2(existing_xmp_path, backup_path)
+    # Read any existing XMP file (in original location); opening it is the
+    # existence check
+    try:
+        with open(existing_xmp_path, "rb") as f:
+            existing_content = f.read()
+    except FileNotFoundError:
+        existing_content = None
 
     # Generate XMP content
-    if existing_xmp is not None:
-        # Update existing XMP
-        updated_xmp = update_xmp_crop(existing_xmp, crop)
-        xmp_content = etree.tostring(
-            updated_xmp,
-            xml_declaration=True,
-            encoding="UTF-8",
-            pretty_print=True
-        ).decode("utf-8")
-
-        # Add xpacket wrapper if not present
-        if "<?xpacket" not in xmp_content:
-            xmp_content = (
-                '<?xpacket begin="\ufeff" id="W5M0MpCehiHzreSzNTczkc9d"?>\n'
-                + xmp_content
-                + '\n<?xpacket end="w"?>'
-            )
-    else:
+    if existing_content is None:
         # Create new XMP from template
-        xmp_content = create_xmp_from_template(crop)
+        xmp_bytes = _create_xmp_bytes(crop)
+    else:
+        # Crop attributes already present can be swapped as text; otherwise
+        # parse and update the existing XMP
+        xmp_bytes = _replace_crop_attributes(existing_content, crop)
+        if xmp_bytes is None:
+            xmp_bytes = _update_xmp_content(existing_content, crop)
+
+    if xmp_path == existing_xmp_path and existing_content == xmp_bytes:
+        return Path(xmp_path), False
+
+    # Create backup if requested. When the sidecar itself is being replaced,
+    # a hard link shares the old file's data without copying it; that's safe
+    # because the write below swaps in a new file instead of overwriting it
+    # in place. A sidecar written elsewhere leaves the original alone, so a
+    # link would track any later edit to it; take a real copy instead.
+    if existing_content is not None and backup:
+        backup_path = existing_xmp_path + ".bak"
+        try:
+            os.remove(backup_path)
+        except FileNotFoundError:
+            pass
+        if xmp_path == existing_xmp_path:
+            try:
+                os.link(existing_xmp_path, backup_path)
+            except OSError:
+                # Filesystem without hard links
+                shutil.copy2(existing_xmp_path, backup_path)
+        else:
+            shutil.copy2(existing_xmp_path, backup_path)
+
+    # The replacement keeps the mode of the file it replaces
+    try:
+        mode = stat.S_IMODE(os.stat(xmp_path).st_mode)
+    except FileNotFoundError:
+        mode = _NEW_FILE_MODE
+
+    # Write XMP file via a uniquely named temporary file next to it, so it is
+    # replaced atomically and concurrent writers don't share a temp file
+    fd, tmp_path = tempfile.mkstemp(
+        dir=os.path.dirname(xmp_path) or ".",
+        prefix=os.path.basename(xmp_path) + ".",
+        suffix=".tmp",
+    )
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(xmp_bytes)
+        os.chmod(tmp_path, mode)
+        os.replace(tmp_path, xmp_path)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except FileNotFoundError:
+            pass
+        raise
+
+    return Path(xmp_path), True
+
+
+def write_crops_to_xmp(
+    items: list[tuple[str | Path, CropRegion]],
+    output_dir: str | Path | None = None,
+    backup: bool = True,
+    max_workers: int = 8,
+) -> Iterator[tuple[Path, bool] | Exception]:
+    """Write crop data for many images, overlapping the sidecar I/O on threads.
+
+    Each item is written as by write_crop_to_xmp. One failure doesn't stop
+    the rest. Items that resolve to the same sidecar (the same image twice,
+    or same-named images sent to one output_dir) are written one after
+    another, in item order, so they never race on the file; the last wins.
+
+    Args:
+        items: (image_path, crop) pairs
+        output_dir: Optional output directory (default: next to each image)
+        backup: Whether to create backup of existing XMP files
+        max_workers: Number of concurrent writes
+
+    Yields:
+        Per item, in order: (xmp_path, written) as from write_crop_to_xmp,
+        or the exception raised
+    """
+    items = list(items)
+    if output_dir is not None:
+        Path(output_dir).mkdir(parents=True, exist_ok=True)
+
+    # Group item indices by the sidecar they write
+    groups: dict[str, list[int]] = {}
+    for i, (image_path, _) in enumerate(items):
+        target = _xmp_path_str(image_path)
+        if output_dir is not None:
+            target = os.path.join(output_dir, os.path.basename(target))
+        groups.setdefault(os.path.realpath(target), []).append(i)
+
+    def write(item: tuple[str | Path, CropRegion]) -> tuple[Path, bool] | Exception:
+        image_path, crop = item
+        try:
+            return write_crop_to_xmp(image_path, crop, output_dir=output_dir, backup=backup)
+        except Exception as e:
+            return e
+
+    def write_group(indices: list[int]) -> list[tuple[Path, bool] | Exception]:
+        return [write(items[i]) for i in indices]
 
-    # Write XMP file
-    with open(xmp_path, "w", encoding="utf-8") as f:
-        f.write(xmp_content)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        # Per item: its group's future and its position within the group
+        slots: dict[int, tuple[Future, int]] = {}
+        for indices in groups.values():
+            future = executor.submit(write_group, indices)
+            for position, i in enumerate(indices):
+                slots[i] = (future, position)
 
-    return xmp_path
+        for i in range(len(items)):
+            future, position = slots[i]
+            yield future.result()[position]
+
+
+def _iter_descriptions(xmp_path: str | Path) -> Iterator[etree._Element]:
+    """Stream the rdf:Description elements of an XMP file.
+
+    Each Description is yielded at its start tag, when its attributes are
+    complete but its children haven't been parsed yet, so a caller that
+    stops early skips the rest of the file. Each one is cleared once
+    parsed past.
+    """
+    with open(xmp_path, "rb") as f:
+        for event, desc in etree.iterparse(
+            f, events=("start", "end"), tag=_RDF_DESCRIPTION,
+            remove_blank_text=True, collect_ids=False,
+        ):
+            if event == "start":
+                yield desc
+                continue
+            desc.clear()
+            while desc.getprevious() is not None:
+                del desc.getparent()[0]
 
 
 def read_crop_from_xmp(xmp_path: str | Path) -> CropRegion | None:
@@ -219,28 +424,20 @@ def read_crop_from_xmp(xmp_path: str | Path) -> CropRegion | None:
     Returns:
         CropRegion if crop data exists, None otherwise
     """
-    root = read_xmp(xmp_path)
-    if root is None:
+    if not os.path.exists(xmp_path):
         return None
 
     # Find crop attributes
-    descriptions = root.xpath(
-        "//rdf:Description",
-        namespaces=NAMESPACES
-    )
-
-    crs_ns = "{" + NAMESPACES["crs"] + "}"
-
-    for desc in descriptions:
-        has_crop = desc.get(crs_ns + "HasCrop")
+    for desc in _iter_descriptions(xmp_path):
+        has_crop = desc.get(_CRS_HAS_CROP)
         if has_crop != "True":
             continue
 
         try:
-            crop_left = float(desc.get(crs_ns + "CropLeft", "0"))
-            crop_right = float(desc.get(crs_ns + "CropRight", "1"))
-            crop_top = float(desc.get(crs_ns + "CropTop", "0"))
-            crop_bottom = float(desc.get(crs_ns + "CropBottom", "1"))
+            crop_left = float(desc.get(_CRS_CROP_LEFT, "0"))
+            crop_right = float(desc.get(_CRS_CROP_RIGHT, "1"))
+            crop_top = float(desc.get(_CRS_CROP_TOP, "0"))
+            crop_bottom = float(desc.get(_CRS_CROP_BOTTOM, "1"))
 
             return CropRegion(
                 left=crop_left,
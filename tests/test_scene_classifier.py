@@ -0,0 +1,100 @@
+"""Tests for scene_classifier module."""
+
+import pytest
+import sys
+from pathlib import Path
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import numpy as np
+from PIL import Image
+
+pytest.importorskip("torch")
+pytest.importorskip("transformers")
+
+from src.scene_classifier import SceneClassifier
+
+
+class TestClassifyImage:
+    """Tests for SceneClassifier.classify_image, with CLIP scoring stubbed out."""
+
+    def test_picks_highest_category(self, tmp_path, monkeypatch):
+        image_path = tmp_path / "photo.jpg"
+        Image.new("RGB", (64, 48), (200, 30, 30)).save(image_path)
+        classifier = SceneClassifier()
+        target = classifier._categories[1]
+        scored = []
+
+        def score(images):
+            scored.extend(images)
+            probs = np.array(
+                [1.0 if p in classifier.SCENE_PROMPTS[target] else 0.0 for p in classifier._all_prompts]
+            )
+            return (probs / probs.sum())[np.newaxis]
+
+        monkeypatch.setattr(classifier, "_load_model", lambda: None)
+        monkeypatch.setattr(classifier, "_score_images", score)
+
+        category, confidence, scores = classifier.classify_image(image_path)
+
+        assert category == target
+        assert confidence == pytest.approx(1.0)
+        assert sum(scores.values()) == pytest.approx(1.0)
+        assert scored[0].mode == "RGB"
+        assert scored[0].size == (64, 48)
+
+
+class TestClassifyBatch:
+    """Tests for SceneClassifier.classify_batch, with CLIP scoring stubbed out."""
+
+    @staticmethod
+    def _samples(tmp_path, colors):
+        paths = []
+        for i, color in enumerate(colors):
+            path = tmp_path / f"photo{i}.jpg"
+            Image.new("RGB", (64, 48), color).save(path)
+            paths.append(path)
+        return paths
+
+    @staticmethod
+    def _prompt_probs(classifier, category):
+        probs = np.array(
+            [1.0 if p in classifier.SCENE_PROMPTS[category] else 0.0 for p in classifier._all_prompts]
+        )
+        return probs / probs.sum()
+
+    def test_failed_batch_falls_back_to_single_images(self, tmp_path, monkeypatch):
+        # The red sample can't be scored, and neither can any multi-image batch
+        paths = self._samples(tmp_path, [(200, 30, 30), (30, 200, 30), (30, 30, 200)])
+        classifier = SceneClassifier()
+        target = classifier._categories[2]
+
+        def score(images):
+            if len(images) > 1 or images[0].getpixel((0, 0))[0] > 150:
+                raise RuntimeError("scoring failed")
+            return self._prompt_probs(classifier, target)[np.newaxis]
+
+        monkeypatch.setattr(classifier, "_load_model", lambda: None)
+        monkeypatch.setattr(classifier, "_score_images", score)
+
+        category, confidence, _ = classifier.classify_batch(paths)
+
+        assert category == target
+        assert confidence == pytest.approx(1.0)
+
+    def test_nothing_scored_uses_default(self, tmp_path, monkeypatch):
+        paths = self._samples(tmp_path, [(200, 30, 30), (30, 200, 30)])
+        classifier = SceneClassifier()
+
+        def score(images):
+            raise RuntimeError("scoring failed")
+
+        monkeypatch.setattr(classifier, "_load_model", lambda: None)
+        monkeypatch.setattr(classifier, "_score_images", score)
+
+        category, confidence, scores = classifier.classify_batch(paths)
+
+        assert category == "portrait"
+        assert confidence == pytest.approx(0.25)
+        assert set(scores.values()) == {0.25}
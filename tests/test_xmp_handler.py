@@ -0,0 +1,298 @@
+"""Tests for xmp_handler module."""
+
+import pytest
+import sys
+from pathlib import Path
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from lxml import etree
+
+from src.crop_calculator import CropRegion
+from src.xmp_handler import (
+    get_xmp_path,
+    read_crop_from_xmp,
+    read_xmp,
+    update_xmp_crop,
+    write_crop_to_xmp,
+    write_crops_to_xmp,
+)
+
+
+class TestWriteCropToXmp:
+    """Tests for write_crop_to_xmp function."""
+
+    def test_new_sidecar_round_trip(self, tmp_path):
+        image_path = tmp_path / "photo.jpg"
+        crop = CropRegion(left=0.1, right=0.9, top=0.2, bottom=0.8)
+
+        xmp_path, _ = write_crop_to_xmp(image_path, crop)
+
+        assert xmp_path == get_xmp_path(image_path)
+        result = read_crop_from_xmp(xmp_path)
+        assert result.left == pytest.approx(0.1)
+        assert result.right == pytest.approx(0.9)
+        assert result.top == pytest.approx(0.2)
+        assert result.bottom == pytest.approx(0.8)
+
+    def test_repeated_updates_stay_readable(self, tmp_path):
+        image_path = tmp_path / "photo.jpg"
+        for left in (0.1, 0.2, 0.3):
+            crop = CropRegion(left=left, right=0.9, top=0.0, bottom=1.0)
+            xmp_path, _ = write_crop_to_xmp(image_path, crop)
+
+        assert read_crop_from_xmp(xmp_path).left == pytest.approx(0.3)
+
+    def test_unchanged_sidecar_is_not_rewritten(self, tmp_path):
+        image_path = tmp_path / "photo.jpg"
+        crop = CropRegion(left=0.1, right=0.9, top=0.0, bottom=1.0)
+        xmp_path, _ = write_crop_to_xmp(image_path, crop)
+        backup_path = xmp_path.with_suffix(".xmp.bak")
+        mtime = xmp_path.stat().st_mtime_ns
+
+        _, written = write_crop_to_xmp(image_path, crop)
+
+        assert not written
+        assert not backup_path.exists()
+        assert xmp_path.stat().st_mtime_ns == mtime
+
+    def test_changed_crop_creates_backup(self, tmp_path):
+        image_path = tmp_path / "photo.jpg"
+        write_crop_to_xmp(image_path, CropRegion(left=0.1, right=0.9, top=0.0, bottom=1.0))
+
+        xmp_path, _ = write_crop_to_xmp(
+            image_path, CropRegion(left=0.2, right=0.9, top=0.0, bottom=1.0)
+        )
+
+        backup_path = xmp_path.with_suffix(".xmp.bak")
+        assert read_crop_from_xmp(backup_path).left == pytest.approx(0.1)
+        assert read_crop_from_xmp(xmp_path).left == pytest.approx(0.2)
+        assert not list(tmp_path.glob("*.tmp"))
+
+    def test_replacement_keeps_file_mode(self, tmp_path):
+        image_path = tmp_path / "photo.jpg"
+        xmp_path, _ = write_crop_to_xmp(image_path, CropRegion(left=0.1, right=0.9, top=0.0, bottom=1.0))
+        xmp_path.chmod(0o640)
+
+        write_crop_to_xmp(image_path, CropRegion(left=0.2, right=0.9, top=0.0, bottom=1.0))
+
+        assert xmp_path.stat().st_mode & 0o777 == 0o640
+
+    def test_failed_write_removes_temp_file(self, tmp_path, monkeypatch):
+        image_path = tmp_path / "photo.jpg"
+
+        def fail(src, dst):
+            raise OSError("disk full")
+
+        monkeypatch.setattr("src.xmp_handler.os.replace", fail)
+        with pytest.raises(OSError):
+            write_crop_to_xmp(image_path, CropRegion(left=0.1, right=0.9, top=0.0, bottom=1.0))
+
+        assert list(tmp_path.iterdir()) == []
+
+    def test_output_dir_backup_is_a_copy(self, tmp_path):
+        image_path = tmp_path / "photo.jpg"
+        original, _ = write_crop_to_xmp(image_path, CropRegion(left=0.1, right=0.9, top=0.0, bottom=1.0))
+
+        write_crop_to_xmp(
+            image_path, CropRegion(left=0.2, right=0.9, top=0.0, bottom=1.0),
+            output_dir=tmp_path / "out",
+        )
+
+        backup_path = original.with_suffix(".xmp.bak")
+        assert not backup_path.samefile(original)
+        assert read_crop_from_xmp(backup_path).left == pytest.approx(0.1)
+
+
+class TestReadCropFromXmp:
+    """Tests for read_crop_from_xmp function."""
+
+    def test_reads_description_outside_xmpmeta(self, tmp_path):
+        xmp_path = tmp_path / "photo.jpg.xmp"
+        xmp_path.write_text(
+            '<rdf:RDF xmlns:rdf="http://www.w3.org/1999/02/22-rdf-syntax-ns#">'
+            '<rdf:Description xmlns:crs="http://ns.adobe.com/camera-raw-settings/1.0/"'
+            ' crs:HasCrop="True" crs:CropLeft="0.25" crs:CropRight="0.75"'
+            ' crs:CropTop="0.1" crs:CropBottom="0.9"/>'
+            '</rdf:RDF>'
+        )
+
+        result = read_crop_from_xmp(xmp_path)
+
+        assert result.left == pytest.approx(0.25)
+        assert result.bottom == pytest.approx(0.9)
+
+    def test_skips_descriptions_without_crop(self, tmp_path):
+        xmp_path = tmp_path / "photo.jpg.xmp"
+        xmp_path.write_text(
+            '<x:xmpmeta xmlns:x="adobe:ns:meta/">'
+            '<rdf:RDF xmlns:rdf="http://www.w3.org/1999/02/22-rdf-syntax-ns#"'
+            ' xmlns:crs="http://ns.adobe.com/camera-raw-settings/1.0/">'
+            '<rdf:Description rdf:about="" crs:Exposure2012="+0.50"/>'
+            '<rdf:Description rdf:about="" crs:HasCrop="False"/>'
+            '<rdf:Description rdf:about="" crs:HasCrop="True" crs:CropLeft="0.3"/>'
+            '</rdf:RDF></x:xmpmeta>'
+        )
+
+        result = read_crop_from_xmp(xmp_path)
+
+        assert result.left == pytest.approx(0.3)
+        assert result.right == pytest.approx(1.0)
+
+    def test_missing_file_returns_none(self, tmp_path):
+        assert read_crop_from_xmp(tmp_path / "missing.jpg.xmp") is None
+
+    def test_no_crop_returns_none(self, tmp_path):
+        image_path = tmp_path / "photo.jpg"
+        xmp_path, _ = write_crop_to_xmp(
+            image_path, CropRegion(left=0.1, right=0.9, top=0.0, bottom=1.0)
+        )
+        xmp_path.write_text(xmp_path.read_text().replace('HasCrop="True"', 'HasCrop="False"'))
+
+        assert read_crop_from_xmp(xmp_path) is None
+
+
+class TestUpdateExistingXmp:
+    """Tests for write_crop_to_xmp on sidecars written by other tools."""
+
+    CRS_XMP = (
+        '<x:xmpmeta xmlns:x="adobe:ns:meta/">\n'
+        ' <rdf:RDF xmlns:rdf="http://www.w3.org/1999/02/22-rdf-syntax-ns#">\n'
+        '  <rdf:Description rdf:about=""\n'
+        '    xmlns:crs="http://ns.adobe.com/camera-raw-settings/1.0/"\n'
+        '    crs:Exposure2012="+0.50"{crop}/>\n'
+        ' </rdf:RDF>\n'
+        '</x:xmpmeta>\n'
+    )
+    CROP_ATTRS = (
+        ' crs:HasCrop="False" crs:CropTop="0" crs:CropLeft="0"'
+        ' crs:CropBottom="1" crs:CropRight="1" crs:CropAngle="0"'
+    )
+
+    def test_crop_attributes_replaced_in_place(self, tmp_path):
+        image_path = tmp_path / "photo.jpg"
+        xmp_path = get_xmp_path(image_path)
+        xmp_path.write_text(self.CRS_XMP.format(crop=self.CROP_ATTRS))
+
+        write_crop_to_xmp(image_path, CropRegion(left=0.1, right=0.9, top=0.2, bottom=0.8))
+
+        expected = self.CRS_XMP.format(crop=(
+            ' crs:HasCrop="True" crs:CropTop="0.200000" crs:CropLeft="0.100000"'
+            ' crs:CropBottom="0.800000" crs:CropRight="0.900000" crs:CropAngle="0"'
+        ))
+        assert xmp_path.read_text() == expected
+
+    def test_missing_crop_attributes_are_added(self, tmp_path):
+        image_path = tmp_path / "photo.jpg"
+        xmp_path = get_xmp_path(image_path)
+        xmp_path.write_text(self.CRS_XMP.format(crop=""))
+
+        write_crop_to_xmp(image_path, CropRegion(left=0.1, right=0.9, top=0.2, bottom=0.8))
+
+        result = read_crop_from_xmp(xmp_path)
+        assert result.left == pytest.approx(0.1)
+        assert result.bottom == pytest.approx(0.8)
+        assert 'crs:Exposure2012="+0.50"' in xmp_path.read_text()
+
+
+class TestWriteCropsToXmp:
+    """Tests for write_crops_to_xmp function."""
+
+    def test_writes_each_item_in_order(self, tmp_path):
+        items = [
+            (tmp_path / f"photo{i}.jpg", CropRegion(left=i / 10, right=0.9, top=0.0, bottom=1.0))
+            for i in range(5)
+        ]
+
+        written = list(write_crops_to_xmp(items, output_dir=tmp_path / "out"))
+
+        assert written == [(tmp_path / "out" / f"photo{i}.jpg.xmp", True) for i in range(5)]
+        for i, (xmp_path, _) in enumerate(written):
+            assert read_crop_from_xmp(xmp_path).left == pytest.approx(i / 10)
+
+    def test_failure_does_not_stop_batch(self, tmp_path):
+        broken = tmp_path / "broken.jpg"
+        get_xmp_path(broken).write_text("not xml")
+        crop = CropRegion(left=0.1, right=0.9, top=0.0, bottom=1.0)
+
+        written = list(write_crops_to_xmp([(broken, crop), (tmp_path / "ok.jpg", crop)]))
+
+        assert isinstance(written[0], Exception)
+        assert written[1] == (get_xmp_path(tmp_path / "ok.jpg"), True)
+
+    def test_reports_unchanged_sidecars(self, tmp_path):
+        image_path = tmp_path / "photo.jpg"
+        crop = CropRegion(left=0.1, right=0.9, top=0.0, bottom=1.0)
+        write_crop_to_xmp(image_path, crop)
+
+        written = list(write_crops_to_xmp([(image_path, crop)]))
+
+        assert written == [(get_xmp_path(image_path), False)]
+
+    def test_duplicate_items_are_written_in_order(self, tmp_path):
+        image_path = tmp_path / "photo.jpg"
+        items = [
+            (image_path, CropRegion(left=left, right=0.9, top=0.0, bottom=1.0))
+            for left in (0.1, 0.2, 0.3, 0.4)
+        ]
+
+        written = list(write_crops_to_xmp(items))
+
+        assert written == [(get_xmp_path(image_path), True)] * 4
+        assert read_crop_from_xmp(get_xmp_path(image_path)).left == pytest.approx(0.4)
+        assert read_crop_from_xmp(image_path.with_suffix(".jpg.xmp.bak")).left == pytest.approx(0.3)
+        assert not list(tmp_path.glob("*.tmp"))
+
+    def test_same_basename_into_output_dir(self, tmp_path):
+        items = [
+            (tmp_path / folder / "photo.jpg", CropRegion(left=i / 10, right=0.9, top=0.0, bottom=1.0))
+            for i, folder in enumerate(("a", "b", "c"))
+        ]
+        for image_path, _ in items:
+            image_path.parent.mkdir()
+
+        written = list(write_crops_to_xmp(items, output_dir=tmp_path / "out"))
+
+        target = tmp_path / "out" / "photo.jpg.xmp"
+        assert written == [(target, True)] * 3
+        assert read_crop_from_xmp(target).left == pytest.approx(0.2)
+        assert [p.name for p in (tmp_path / "out").iterdir()] == ["photo.jpg.xmp"]
+
+
+class TestUpdateXmpCrop:
+    """Tests for update_xmp_crop function."""
+
+    def test_crop_goes_on_camera_raw_description(self):
+        root = etree.fromstring(
+            '<x:xmpmeta xmlns:x="adobe:ns:meta/">'
+            '<rdf:RDF xmlns:rdf="http://www.w3.org/1999/02/22-rdf-syntax-ns#">'
+            '<rdf:Description xmlns:dc="http://purl.org/dc/elements/1.1/" dc:format="image/jpeg"/>'
+            '<rdf:Description xmlns:crs="http://ns.adobe.com/camera-raw-settings/1.0/"'
+            ' crs:Version="15.0"/>'
+            '</rdf:RDF></x:xmpmeta>'
+        )
+
+        update_xmp_crop(root, CropRegion(left=0.1, right=0.9, top=0.2, bottom=0.8))
+
+        first, second = root.iter("{http://www.w3.org/1999/02/22-rdf-syntax-ns#}Description")
+        crs = "{http://ns.adobe.com/camera-raw-settings/1.0/}"
+        assert first.get(crs + "HasCrop") is None
+        assert second.get(crs + "HasCrop") == "True"
+        assert second.get(crs + "CropLeft") == "0.100000"
+
+
+class TestReadXmp:
+    """Tests for read_xmp function."""
+
+    def test_parses_sidecar(self, tmp_path):
+        xmp_path, _ = write_crop_to_xmp(
+            tmp_path / "photo.jpg", CropRegion(left=0.1, right=0.9, top=0.0, bottom=1.0)
+        )
+
+        root = read_xmp(xmp_path)
+
+        assert root.tag == "{adobe:ns:meta/}xmpmeta"
+
+    def test_missing_file_returns_none(self, tmp_path):
+        assert read_xmp(tmp_path / "missing.jpg.xmp") is None